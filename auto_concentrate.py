@@ -8,17 +8,326 @@ without requiring manual entry.
 """
 
 import re
+import os
 import json
+import mmap
 import sys
+from collections import Counter, OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from berry_manager import BerryManager
-from member import ClaudeMDManager
+# BerryManager (and numpy behind it) and ClaudeMDManager are imported where
+# they are used, so MemoryExtractor loads without the storage stack
+if TYPE_CHECKING:
+    from berry_manager import BerryManager
+
+# Optional Aho-Corasick matcher for single-pass keyword scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional fast JSON parser for transcript lines
+try:
+    import orjson
+
+    def _json_loads(data):
+        """Parse a JSON document with orjson, retrying with json if it refuses.
+
+        orjson rejects input json accepts, such as escaped lone surrogates
+        (tool output cut mid-emoji) and NaN/Infinity, so one such line
+        would otherwise fail the whole transcript.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:
+    _json_loads = json.loads
+
+
+
+# === COMPILED PATTERNS ===
+# Hot-path regexes are compiled once at import instead of per call.
+
+# Emphasis detection
+_CAPS_RE = re.compile(r'\b([A-Z]{3,})\b')
+_EXCLAIM_RE = re.compile(r'(\w+)!')
+_EMPHASIS_MARKER_RES = [
+    re.compile(r'\*\*(\w+)\*\*'),  # **bold**
+    re.compile(r'\*(\w+)\*'),      # *italic*
+    re.compile(r'_(\w+)_'),        # _underline_
+]
+# Non-word characters other than the space that separates tokens
+_NON_WORD_RE = re.compile(r'[^\w ]')
+# Deletes ASCII non-word characters; the str.translate twin of _NON_WORD_RE
+_CLEAN_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c == '_' or c == ' ')
+))
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Signal-based extraction
+_REQUEST_RES = [
+    re.compile(r"(?:please|help me|can you|could you)\s+([^.?!]+)[.?!]?", re.IGNORECASE),
+    re.compile(r"(?:i need|i want|trying to)\s+([^.?!]+)[.?!]?", re.IGNORECASE),
+    re.compile(r"(?:how do i|how can i)\s+([^.?!]+)\??", re.IGNORECASE),
+]
+_REPETITION_RES = [
+    re.compile(r"(?:again|still|keep getting|keeps happening)\s*[,:]?\s*([^.!?]+)[.!?]?", re.IGNORECASE),
+    re.compile(r"(?:same|recurring)\s+(?:issue|problem|error)[:\s]+([^.!?]+)[.!?]?", re.IGNORECASE),
+    re.compile(r"(?:as i mentioned|like before)[,:]?\s*([^.!?]+)[.!?]?", re.IGNORECASE),
+]
+_SUCCESS_RES = [
+    re.compile(r"(?:that worked|works now|fixed it|solved)[.!]?\s*([^.!?]*(?:by|with|using)[^.!?]+)[.!?]?", re.IGNORECASE),
+    re.compile(r"(?:perfect|exactly what i needed)[.!]?\s*([^.!?]+)[.!?]?", re.IGNORECASE),
+]
+
+_STRUCTURED_ERROR_RES = [
+    # "Error: X → Fix: Y" or "Error: X - Resolution: Y"
+    re.compile(r"(?:error|issue|problem):\s*([^→\-\n]+)(?:→|\s*-\s*)(?:fix|solution|resolution):\s*([^\n]+)", re.IGNORECASE),
+    # "Fixed X by Y" or "Resolved X by Y"
+    re.compile(r"(?:fixed|resolved|solved)\s+(?:the\s+)?([^.]+?)\s+by\s+([^.]+)", re.IGNORECASE),
+    # "X was caused by Y" (error is X, resolution context is Y)
+    re.compile(r"([^.]+?)\s+(?:was\s+)?(?:caused\s+by|due\s+to)\s+([^.]+)", re.IGNORECASE),
+    # "The solution to X is Y"
+    re.compile(r"(?:the\s+)?solution\s+to\s+([^.]+?)\s+is\s+([^.]+)", re.IGNORECASE),
+]
+# What must follow the leading ([^.]+?) of "X was caused by Y", for
+# _finditer_clauses; the other structured patterns open with a keyword
+_CAUSE_TAIL_RE = re.compile(r"\s+(?:was\s+)?(?:caused\s+by|due\s+to)\s+[^.]", re.IGNORECASE)
+_STRUCTURED_ERROR_TAILS = [None, None, _CAUSE_TAIL_RE, None]
+
+# Code blocks with a line of context before them
+_CODE_BLOCK_RE = re.compile(r"([^\n]+)\n```(\w+)\n([\s\S]+?)```")
+
+# Memory refinements: "memberberry refine <id>: <summary>" and friends
+_REFINEMENT_RES = [
+    re.compile(r"memberberry\s+refine\s+([a-f0-9]{6,12}):\s*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"refine\s+memory\s+([a-f0-9]{6,12}):\s*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"`([a-f0-9]{6,12})`\s*(?:should be|better as|refine to):\s*(.+?)(?:\n|$)", re.IGNORECASE),
+]
+
+# Claude-authored markers: "[MEMORY #tag1 #tag2] summary" and "[ARCHIVE <id>]"
+_MEMORY_MARKER_RE = re.compile(r'\[MEMORY\s+((?:#\w+\s*)+)\]\s*(.+?)(?:\n|$)', re.IGNORECASE)
+_MARKER_TAG_RE = re.compile(r'#(\w+)')
+_ARCHIVE_MARKER_RE = re.compile(r'\[ARCHIVE\s+([a-f0-9]{8})\]', re.IGNORECASE)
+
+# Context helpers
+_QUESTION_RE = re.compile(r'(?:how (?:do|can|to)|what|why|when)[^?]*\?', re.IGNORECASE)
+_NEED_RE = re.compile(r'(?:i need to|trying to|want to|need help with)([^.]+)', re.IGNORECASE)
+_FIX_RE = re.compile(r'(?:to fix|solution|resolve|try|use|change|update|install)([^.]+\.)', re.IGNORECASE)
+_REASON_RE = re.compile(r'(?:because|since|as it|this causes|leads to|results in)([^.]+)', re.IGNORECASE)
+_ALT_RE = re.compile(r'(?:instead|use|try|prefer|better to|should)([^.]+)', re.IGNORECASE)
+# Line numbers from captured tool output, e.g. "1380→"
+_LINE_NUMBER_RE = re.compile(r'\d{2,}→')
+# Deletes the JSON punctuation counted by the garbage special-character ratio
+_SPECIAL_CHARS_TABLE = str.maketrans('', '', '{}[]"\':,')
+
+# Literals one of which must appear for the helper regex to match
+_NEED_LITERALS = ('i need to', 'trying to', 'want to', 'need help with')
+_REASON_LITERALS = ('because', 'since', 'as it', 'this causes', 'leads to', 'results in')
+
+
+def _fold_case(pattern: re.Pattern) -> re.Pattern:
+    """Case-sensitive twin of an IGNORECASE pattern, for lowercased ASCII text.
+
+    Literals are lowercased and escapes left alone, so for ASCII text
+    twin.finditer(text.lower()) reports the same spans as
+    pattern.finditer(text), without re's per-character case folding.
+    Groups of a twin's match hold lowercased text, so callers read them
+    back from the original text by span: text[match.start(g):match.end(g)].
+    """
+    source = re.sub(
+        r'\\.|[A-Z]+',
+        lambda m: m.group() if m.group().startswith('\\') else m.group().lower(),
+        pattern.pattern
+    )
+    return re.compile(source, pattern.flags & ~re.IGNORECASE)
+
+
+_STRUCTURED_ERROR_FOLDED = [_fold_case(pattern) for pattern in _STRUCTURED_ERROR_RES]
+_MEMORY_MARKER_FOLDED = _fold_case(_MEMORY_MARKER_RE)
+_ARCHIVE_MARKER_FOLDED = _fold_case(_ARCHIVE_MARKER_RE)
+_QUESTION_FOLDED = _fold_case(_QUESTION_RE)
+_NEED_FOLDED = _fold_case(_NEED_RE)
+_FIX_FOLDED = _fold_case(_FIX_RE)
+_REASON_FOLDED = _fold_case(_REASON_RE)
+_ALT_FOLDED = _fold_case(_ALT_RE)
+
+
+def _fold_finditer(pattern: re.Pattern, folded: re.Pattern, text: str,
+                   text_lower: Optional[str] = None, literals: Tuple[str, ...] = ()):
+    """pattern.finditer(text), run as folded over the lowercase copy if text is ASCII.
+
+    Pass text_lower when the caller already has it. For ASCII text, nothing
+    is searched when `literals` are given and none of them occurs.
+    """
+    if not text.isascii():
+        return pattern.finditer(text)
+    if text_lower is None:
+        text_lower = text.lower()
+    if literals and not any(literal in text_lower for literal in literals):
+        return iter(())
+    return folded.finditer(text_lower)
+
+
+def _finditer_clauses(pattern: re.Pattern, tail: re.Pattern, text: str):
+    """pattern.finditer(text) for a pattern shaped ([^.]+?)<tail>[^.]*.
+
+    re tries such a pattern from every position, and each failed try runs
+    to the next period, so a long period-free text (a log or JSON paste)
+    takes quadratic time. A match can only start where some later tail
+    match lies in the same clause, so only those clauses are matched:
+    one search for the tail finds the next one.
+    """
+    pos = 0
+    while True:
+        hit = tail.search(text, pos + 1)
+        if hit is None:
+            return
+        dot = text.rfind('.', pos, hit.start())
+        if dot != -1:
+            # The tail lies in a later clause; look again from its start
+            pos = dot + 1
+            continue
+        match = pattern.match(text, pos)
+        if match is None:
+            return
+        yield match
+        pos = match.end()
+
+
+def _build_automaton(keywords: Dict[str, List[str]]):
+    """Build an Aho-Corasick automaton mapping each keyword to its categories.
+
+    Returns None when pyahocorasick is not installed, so callers can fall
+    back to plain substring checks.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for category, words in keywords.items():
+        for word in words:
+            automaton.add_word(word, automaton.get(word, ()) + (category,))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_mask_automaton(keywords: Dict[str, List[str]]):
+    """Build an Aho-Corasick automaton mapping each keyword to a category bitmask.
+
+    Bit i stands for the i-th category of `keywords`, so a scan can OR the
+    values together and decode the result in category order. Returns None
+    when pyahocorasick is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for bit, words in enumerate(keywords.values()):
+        for word in words:
+            automaton.add_word(word, automaton.get(word, 0) | (1 << bit))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_mask_table(names: Tuple[str, ...], limit: int) -> List[Tuple[str, ...]]:
+    """Precompute bitmask -> names decoding for masks from _build_mask_automaton.
+
+    Entry m holds the names whose bits are set in m, in order, capped at
+    `limit`. Each pass appends one name to a copy of every entry so far.
+    """
+    table = [()]
+    for name in names:
+        table += [entry + (name,) if len(entry) < limit else entry for entry in table]
+    return table
+
+
+def _clean_words(words: List[str]) -> List[str]:
+    """Strip non-word characters from every word in a single pass.
+
+    The words are joined with single spaces and cleaned as one string, so
+    the result lines up with the input even when a word cleans to ''.
+    """
+    joined = ' '.join(words)
+    if joined.isascii():
+        cleaned = joined.translate(_CLEAN_TABLE)
+    else:
+        cleaned = _NON_WORD_RE.sub('', joined)
+    return cleaned.split(' ')
+
+
+def _find_close_repeats(tokens, window: int = 10) -> List[str]:
+    """Return tokens that recur within `window` positions of their last use.
+
+    Args:
+        tokens: Iterable of (position, word) pairs in text order
+
+    Returns:
+        Words seen again within the window, once per close repetition
+    """
+    repeats = []
+    last_seen = {}
+    for position, word in tokens:
+        previous = last_seen.get(word)
+        if previous is not None and position - previous < window:
+            repeats.append(word)
+        last_seen[word] = position
+    return repeats
+
+
+def _read_last_lines(path: Path, count: int) -> List[bytes]:
+    """Return the last `count` non-blank lines of a file, reading from the end.
+
+    The file is memory-mapped and walked backwards one newline at a time,
+    so only the pages holding the last few lines are touched, however long
+    the transcript or its individual lines are.
+    """
+    if count <= 0:
+        return []
+
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        if not size:
+            return []
+
+        lines = []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size
+            while end > 0 and len(lines) < count:
+                start = mm.rfind(b'\n', 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start - 1
+
+    lines.reverse()
+    return lines
+
+
+def _join_content_blocks(blocks: list) -> str:
+    """Join a message's content blocks (text dicts or strings), one per line."""
+    parts = []
+    for item in blocks:
+        if isinstance(item, dict) and 'text' in item:
+            parts.append(item['text'] + "\n")
+        elif isinstance(item, str):
+            parts.append(item + "\n")
+    return "".join(parts)
+
+
+# Message 'content' type -> function returning its text
+_CONTENT_READERS = {
+    str: lambda content: content,
+    list: _join_content_blocks,
+}
 
 
 class MemoryExtractor:
@@ -37,12 +346,14 @@ class MemoryExtractor:
         r"I'm (?:using|implementing|going with)\s+([^.!?\n]+)",
         r"(?:I'll|Let me|Going to)\s+use\s+([^.!?\n]+?)(?:\s+(?:because|since|for))",
     ]
+    _DECISION_RES = [re.compile(p, re.IGNORECASE) for p in DECISION_PATTERNS]
 
     REASONING_PATTERNS = [
         r"(?:because|since|the reason is|this is because)\s+([^.!?\n]+)",
         r"(?:This|It)(?:'s| is) (?:better|cleaner|simpler|faster|more efficient)\s+(?:because\s+)?([^.!?\n]+)",
         r"(?:The benefit|advantage|upside)(?:\s+(?:is|of this))?\s*[:\-]?\s*([^.!?\n]+)",
     ]
+    _REASONING_RES = [re.compile(p, re.IGNORECASE) for p in REASONING_PATTERNS]
 
     IMPLEMENTATION_PATTERNS = [
         r"(?:The implementation|Here's how|The approach)[:\-]?\s*([^.!?\n]+)",
@@ -54,6 +365,7 @@ class MemoryExtractor:
         r"## (?:Summary|Changes|Implementation|Decision)[^\n]*\n([\s\S]+?)(?=\n##|\n---|\Z)",
         r"(?:In summary|To summarize|TL;DR)[,:\-]?\s*([^.!?\n]+(?:[.!?\n][^.!?\n]+)*)",
     ]
+    _SUMMARY_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in SUMMARY_PATTERNS]
 
     # === SEMANTIC SIGNALS ===
     # These indicate important moments worth capturing
@@ -105,6 +417,18 @@ class MemoryExtractor:
         'note that', 'key thing', 'essential', 'vital', 'must remember'
     ]
 
+    # Signal category -> signal list, as reported by detect_signals()
+    SIGNAL_CATEGORIES = {
+        'request': REQUEST_SIGNALS,
+        'repetition': REPETITION_SIGNALS,
+        'success': SUCCESS_SIGNALS,
+        'failure': FAILURE_SIGNALS,
+        'learning': LEARNING_SIGNALS,
+        'best_practice': BEST_PRACTICE_SIGNALS,
+        'emphasis': EMPHASIS_SIGNALS,
+    }
+    _SIGNAL_AUTOMATON = _build_automaton(SIGNAL_CATEGORIES)
+
     # === EXTRACTION PATTERNS ===
 
     # Patterns that indicate a solution
@@ -113,18 +437,24 @@ class MemoryExtractor:
         r"(?:solved by|fixed by|resolved by|the answer is)(.*?)(?:\.|$)",
         r"(?:you should|you need to|make sure to|remember to)(.*?)(?:\.|$)",
     ]
+    _SOLUTION_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in SOLUTION_PATTERNS]
+    _SOLUTION_FOLDED = [_fold_case(pattern) for pattern in _SOLUTION_RES]
 
     # Patterns that indicate an error resolution
     ERROR_PATTERNS = [
         r"(?:error|exception|failed|failure)[\s:]+([^\n]+)",
         r"(?:ModuleNotFoundError|ImportError|TypeError|ValueError|KeyError|AttributeError|RuntimeError)[\s:]+([^\n]+)",
     ]
+    _ERROR_RES = [re.compile(p, re.IGNORECASE) for p in ERROR_PATTERNS]
+    _ERROR_FOLDED = [_fold_case(pattern) for pattern in _ERROR_RES]
 
     # Patterns that indicate antipatterns
     ANTIPATTERN_PATTERNS = [
         r"(?:don't|do not|avoid|never|shouldn't|should not)\s+([^.]+?)(?:\s+because|\s+since|\s+as\s+it|\.)",
         r"(?:instead of|rather than)\s+([^,]+),?\s+(?:use|try|consider)",
     ]
+    _ANTIPATTERN_RES = [re.compile(p, re.IGNORECASE) for p in ANTIPATTERN_PATTERNS]
+    _ANTIPATTERN_FOLDED = [_fold_case(pattern) for pattern in _ANTIPATTERN_RES]
 
     # Patterns for dependencies/packages
     DEPENDENCY_PATTERNS = [
@@ -132,6 +462,7 @@ class MemoryExtractor:
         r"(?:pip install|npm install|yarn add)\s+([^\s]+)",
         r"(?:import|from)\s+([a-zA-Z_][a-zA-Z0-9_]*)",
     ]
+    _DEPENDENCY_RES = [re.compile(p, re.IGNORECASE) for p in DEPENDENCY_PATTERNS]
 
     # Common tech keywords for auto-tagging
     TECH_KEYWORDS = {
@@ -148,10 +479,188 @@ class MemoryExtractor:
         'performance': ['performance', 'optimize', 'cache', 'speed', 'slow', 'fast'],
         'error': ['error', 'exception', 'bug', 'fix', 'debug', 'issue'],
     }
+    _TAG_AUTOMATON = _build_mask_automaton(TECH_KEYWORDS)
+    _TAG_TABLE = _build_mask_table(tuple(TECH_KEYWORDS), limit=5)  # Limit to 5 tags
+
+    # Markers of garbage content (raw JSON, API responses, template text, etc.)
+    GARBAGE_MARKERS = [
+        # Raw API response fragments
+        "{'model':", "'type': 'msg'", "'role': 'assistant'",
+        '"model":', '"type": "message"', '"role": "assistant"',
+        'claude-opus', 'claude-sonnet', 'claude-haiku',
+        'msg_01', '{"id":', 'noreply@anthropic',
+        'stop_reason', 'stop_sequence', 'input_tokens',
+        'cache_creation_input_tokens', 'cache_read_input_tokens',
+        'tool_use_id', 'tool_result', 'output_tokens',
+
+        # Template text from CLAUDE.md (should never be stored as memory)
+        'MEMBERBERRIES CONTEXT', 'Auto-managed, do not edit',
+        'END MEMBERBERRIES', 'How to use this context:',
+        'Pinned = Protected info', 'High Gravity = Frequently',
+        'Active Task = Current focus', 'Memories ranked by importance',
+
+        # System reminder content (should never be extracted)
+        '<system-reminder>', '</system-reminder>',
+        'persisted-output', 'function_results',
+        'system-reminder>',
+        'analyze existing code, write reports',
+        'MUST refuse to improve or augment',
+        'should consider whether it would be considered malware',
+
+        # Memberberries' own template/placeholder text
+        'User need:', 'Repeated issue:', 'General solution',
+        '(Captured from conversation', '(Auto-captured',
+        '(Claude-authored memory)', '(pending resolution)',
+        'pending resolution)',
+
+        # Tool/internal markers
+        'antml:invoke', 'antml:parameter',
+        '<function_results>', '</function_results>',
+
+        # Malformed JSON/data fragments
+        '}}], ', "[{'", "'}]", '}], ', "': [{'",
+        "'content': [{'", '"content": [{"',
+    ]
+    _GARBAGE_AUTOMATON = _build_automaton({'garbage': GARBAGE_MARKERS})
+
+    # Common abbreviations for shorthand compression
+    SHORTHAND_ABBREVIATIONS = {
+        'function': 'fn',
+        'variable': 'var',
+        'parameter': 'param',
+        'configuration': 'config',
+        'application': 'app',
+        'directory': 'dir',
+        'repository': 'repo',
+        'environment': 'env',
+        'development': 'dev',
+        'production': 'prod',
+        'authentication': 'auth',
+        'authorization': 'authz',
+        'database': 'db',
+        'information': 'info',
+        'documentation': 'docs',
+        'implementation': 'impl',
+        'specification': 'spec',
+        'requirements': 'reqs',
+        'dependencies': 'deps',
+        'dependency': 'dep',
+        'component': 'comp',
+        'components': 'comps',
+        'interface': 'iface',
+        'initialize': 'init',
+        'initialization': 'init',
+        'administrator': 'admin',
+        'management': 'mgmt',
+        'message': 'msg',
+        'messages': 'msgs',
+        'response': 'resp',
+        'request': 'req',
+        'execute': 'exec',
+        'command': 'cmd',
+        'commands': 'cmds',
+        'reference': 'ref',
+        'attribute': 'attr',
+        'attributes': 'attrs',
+        'property': 'prop',
+        'properties': 'props',
+        'expression': 'expr',
+        'argument': 'arg',
+        'arguments': 'args',
+        'maximum': 'max',
+        'minimum': 'min',
+        'number': 'num',
+        'string': 'str',
+        'integer': 'int',
+        'boolean': 'bool',
+        'character': 'char',
+        'temporary': 'tmp',
+        'source': 'src',
+        'destination': 'dest',
+        'previous': 'prev',
+        'current': 'curr',
+        'original': 'orig',
+        'package': 'pkg',
+        'packages': 'pkgs',
+        'version': 'ver',
+        'utility': 'util',
+        'utilities': 'utils',
+        'library': 'lib',
+        'libraries': 'libs',
+        'object': 'obj',
+        'objects': 'objs',
+        'index': 'idx',
+        'buffer': 'buf',
+        'context': 'ctx',
+        'navigation': 'nav',
+        'button': 'btn',
+        'image': 'img',
+        'javascript': 'JS',
+        'typescript': 'TS',
+        'python': 'py',
+        'because': 'b/c',
+        'without': 'w/o',
+        'with': 'w/',
+        'approximately': '~',
+        'greater than': '>',
+        'less than': '<',
+    }
+
+    # Filler words to remove (carefully - only when they don't add meaning)
+    FILLER_WORDS = [
+        'actually', 'basically', 'essentially', 'literally',
+        'just', 'simply', 'really', 'very', 'quite',
+    ]
+    # Single-pass alternations; longest keys first so "authorization" wins over "auth"
+    _ABBREVIATION_MAP = {full.lower(): short for full, short in SHORTHAND_ABBREVIATIONS.items()}
+    _ABBREVIATION_RE = re.compile(
+        r'\b(' + '|'.join(re.escape(full) for full in sorted(SHORTHAND_ABBREVIATIONS, key=len, reverse=True)) + r')\b',
+        re.IGNORECASE
+    )
+    _FILLER_RE = re.compile(r'\b(?:' + '|'.join(FILLER_WORDS) + r')\b\s*', re.IGNORECASE)
+
+    # Natural break points for _smart_truncate, most preferred first
+    _BREAK_CHARS = ('. ', '! ', '? ', '; ', ', ', ' - ', '\n')
+
+    # ALL CAPS words that are ordinary acronyms, not emphasis
+    COMMON_ACRONYMS = frozenset({'API', 'URL', 'HTTP', 'HTML', 'CSS', 'SQL', 'JSON', 'XML', 'SDK', 'CLI'})
 
     def __init__(self, berry_manager: 'BerryManager' = None):
         self.extracted_memories = []
         self.bm = berry_manager  # For adaptive learning
+        self._token_cache = (None, [])  # (text_lower, tokens) of the last text tokenized
+        self._lower_cache = (None, '')  # (text, text.lower()) of the last text lowercased
+
+    def _lower(self, text: str) -> str:
+        """Return text.lower(), reusing the result for the most recent text.
+
+        Emphasis detection, learning and importance scoring are handed the
+        same message object in turn, so it is case-folded only once.
+        """
+        cached_text, text_lower = self._lower_cache
+        if cached_text is not text:
+            text_lower = text.lower()
+            self._lower_cache = (text, text_lower)
+        return text_lower
+
+    def _finditer(self, pattern: re.Pattern, folded: re.Pattern, text: str):
+        """_fold_finditer, reusing the cached lowercase copy of text."""
+        text_lower = self._lower(text) if text.isascii() else None
+        return _fold_finditer(pattern, folded, text, text_lower)
+
+    def _tokenize(self, text_lower: str) -> List[Tuple[str, str]]:
+        """Split lowercased text into (raw, cleaned) word pairs.
+
+        The result for the most recent text is cached, since emphasis
+        detection, learning and importance scoring all tokenize the same
+        message back to back.
+        """
+        cached_text, tokens = self._token_cache
+        if cached_text != text_lower:
+            words = text_lower.split()
+            tokens = list(zip(words, _clean_words(words))) if words else []
+            self._token_cache = (text_lower, tokens)
+        return tokens
 
     def detect_emphasis_patterns(self, text: str) -> List[str]:
         """Detect words that appear to be emphasized by the user.
@@ -163,69 +672,70 @@ class MemoryExtractor:
         - Repeated words within a short span
         """
         emphasized = []
+        text_lower = self._lower(text)
+
+        # Each scan below is skipped when the text lacks the characters it
+        # needs, which is the common case for plain prose and pasted logs
 
         # ALL CAPS words (3+ letters, not common acronyms)
-        caps_pattern = r'\b([A-Z]{3,})\b'
-        common_acronyms = {'API', 'URL', 'HTTP', 'HTML', 'CSS', 'SQL', 'JSON', 'XML', 'SDK', 'CLI'}
-        for match in re.finditer(caps_pattern, text):
-            word = match.group(1)
-            if word not in common_acronyms:
-                emphasized.append(word.lower())
+        if text_lower != text:
+            for match in _CAPS_RE.finditer(text):
+                word = match.group(1)
+                if word not in self.COMMON_ACRONYMS:
+                    emphasized.append(word.lower())
 
         # Words before exclamation marks
-        exclaim_pattern = r'(\w+)!'
-        for match in re.finditer(exclaim_pattern, text):
-            emphasized.append(match.group(1).lower())
+        if '!' in text:
+            for match in _EXCLAIM_RE.finditer(text):
+                emphasized.append(match.group(1).lower())
 
         # Words in emphasis markers (*word*, _word_, **word**)
-        emphasis_markers = [
-            r'\*\*(\w+)\*\*',  # **bold**
-            r'\*(\w+)\*',      # *italic*
-            r'_(\w+)_',        # _underline_
+        if '*' in text or '_' in text:
+            for pattern in _EMPHASIS_MARKER_RES:
+                for match in pattern.finditer(text):
+                    emphasized.append(match.group(1).lower())
+
+        # Detect repeated words within close proximity (sign of emphasis):
+        # the same word within 10 words of its last use
+        tokens = [
+            (i, cleaned) for i, (word, cleaned) in enumerate(self._tokenize(text_lower))
+            if len(word) > 3
         ]
-        for pattern in emphasis_markers:
-            for match in re.finditer(pattern, text):
-                emphasized.append(match.group(1).lower())
+        emphasized.extend(_find_close_repeats(tokens, window=10))
 
-        # Detect repeated words within close proximity (sign of emphasis)
-        words = text.lower().split()
-        word_positions = {}
-        for i, word in enumerate(words):
-            if len(word) > 3:  # Skip short words
-                word = re.sub(r'[^\w]', '', word)
-                if word in word_positions:
-                    # If same word appears within 10 words, it's emphasized
-                    if i - word_positions[word] < 10:
-                        emphasized.append(word)
-                word_positions[word] = i
-
-        return list(set(emphasized))
-
-    def learn_from_text(self, text: str):
+        # Deduplicate in first-seen order so callers' top-N slices are stable
+        return list(dict.fromkeys(emphasized))
+
+    def learn_from_text(self, text: str, emphasized: List[str] = None):
         """Learn user-specific signal words from their communication.
 
         Analyzes text for emphasis patterns and updates the learning model.
+
+        Args:
+            text: User text to learn from
+            emphasized: Result of detect_emphasis_patterns(text), if the
+                caller already has it
         """
         if not self.bm:
             return
 
         # Detect emphasis patterns
-        emphasized = self.detect_emphasis_patterns(text)
-        for word in emphasized:
-            self.bm.learn_signal(word, "emphasis", weight=1)
+        if emphasized is None:
+            emphasized = self.detect_emphasis_patterns(text)
+        signals = [(word, "emphasis", 1) for word in emphasized]
 
-        # Track word frequencies for repetition learning
-        words = text.lower().split()
-        word_counts = {}
-        for word in words:
-            word = re.sub(r'[^\w]', '', word)
-            if len(word) > 4:  # Skip short words
-                word_counts[word] = word_counts.get(word, 0) + 1
+        # Track word frequencies for repetition learning (skip short words)
+        word_counts = Counter(
+            word for _, word in self._tokenize(self._lower(text)) if len(word) > 4
+        )
 
         # Learn words that appear frequently in this text
         for word, count in word_counts.items():
             if count >= 3:  # Appeared 3+ times in this message
-                self.bm.learn_signal(word, "repeated", weight=count // 3)
+                signals.append((word, "repeated", count // 3))
+
+        # One bulk update, so the index is saved once per message
+        self.bm.learn_signals(signals)
 
     def _smart_truncate(self, text: str, max_len: int = 500) -> str:
         """Truncate text intelligently, preserving complete thoughts.
@@ -235,21 +745,22 @@ class MemoryExtractor:
         if len(text) <= max_len:
             return text
 
-        # Look for natural break points before max_len
-        break_chars = ['. ', '! ', '? ', '; ', ', ', ' - ', '\n']
+        # Look for natural break points before max_len, in priority order
         best_break = max_len
+        # Breaks must keep at least 60% of content, so only search past that
+        min_idx = int(max_len * 0.6) + 1
 
         # Find the last natural break before max_len
-        for char in break_chars:
-            idx = text.rfind(char, 0, max_len)
-            if idx != -1 and idx > max_len * 0.6:  # At least 60% of content
+        for char in self._BREAK_CHARS:
+            idx = text.rfind(char, min_idx, max_len)
+            if idx != -1:
                 best_break = idx + len(char)
                 break
 
         # If no good break found, break at word boundary
         if best_break == max_len:
-            space_idx = text.rfind(' ', 0, max_len)
-            if space_idx > max_len * 0.6:
+            space_idx = text.rfind(' ', min_idx, max_len)
+            if space_idx != -1:
                 best_break = space_idx
 
         return text[:best_break].strip() + "..."
@@ -259,133 +770,61 @@ class MemoryExtractor:
 
         Uses common abbreviations and removes filler words.
         """
-        # Common abbreviations
-        abbrevs = {
-            'function': 'fn',
-            'variable': 'var',
-            'parameter': 'param',
-            'configuration': 'config',
-            'application': 'app',
-            'directory': 'dir',
-            'repository': 'repo',
-            'environment': 'env',
-            'development': 'dev',
-            'production': 'prod',
-            'authentication': 'auth',
-            'authorization': 'authz',
-            'database': 'db',
-            'information': 'info',
-            'documentation': 'docs',
-            'implementation': 'impl',
-            'specification': 'spec',
-            'requirements': 'reqs',
-            'dependencies': 'deps',
-            'dependency': 'dep',
-            'component': 'comp',
-            'components': 'comps',
-            'interface': 'iface',
-            'initialize': 'init',
-            'initialization': 'init',
-            'administrator': 'admin',
-            'management': 'mgmt',
-            'message': 'msg',
-            'messages': 'msgs',
-            'response': 'resp',
-            'request': 'req',
-            'execute': 'exec',
-            'command': 'cmd',
-            'commands': 'cmds',
-            'reference': 'ref',
-            'attribute': 'attr',
-            'attributes': 'attrs',
-            'property': 'prop',
-            'properties': 'props',
-            'expression': 'expr',
-            'argument': 'arg',
-            'arguments': 'args',
-            'maximum': 'max',
-            'minimum': 'min',
-            'number': 'num',
-            'string': 'str',
-            'integer': 'int',
-            'boolean': 'bool',
-            'character': 'char',
-            'temporary': 'tmp',
-            'source': 'src',
-            'destination': 'dest',
-            'previous': 'prev',
-            'current': 'curr',
-            'original': 'orig',
-            'package': 'pkg',
-            'packages': 'pkgs',
-            'version': 'ver',
-            'utility': 'util',
-            'utilities': 'utils',
-            'library': 'lib',
-            'libraries': 'libs',
-            'object': 'obj',
-            'objects': 'objs',
-            'index': 'idx',
-            'buffer': 'buf',
-            'buffer': 'buf',
-            'context': 'ctx',
-            'navigation': 'nav',
-            'button': 'btn',
-            'image': 'img',
-            'javascript': 'JS',
-            'typescript': 'TS',
-            'python': 'py',
-            'because': 'b/c',
-            'without': 'w/o',
-            'with': 'w/',
-            'approximately': '~',
-            'greater than': '>',
-            'less than': '<',
-        }
-
-        # Filler words to remove (carefully - only when they don't add meaning)
-        filler_words = [
-            'actually', 'basically', 'essentially', 'literally',
-            'just', 'simply', 'really', 'very', 'quite',
-        ]
-
-        result = text
-
-        # Apply abbreviations (case-insensitive, preserve casing)
-        for full, short in abbrevs.items():
-            pattern = re.compile(re.escape(full), re.IGNORECASE)
-            result = pattern.sub(short, result)
+        # Apply abbreviations (case-insensitive, whole words only)
+        result = self._ABBREVIATION_RE.sub(
+            lambda m: self._ABBREVIATION_MAP[m.group(1).lower()], text
+        )
 
         # Remove filler words (only at word boundaries)
-        for filler in filler_words:
-            pattern = re.compile(r'\b' + filler + r'\b\s*', re.IGNORECASE)
-            result = pattern.sub('', result)
+        result = self._FILLER_RE.sub('', result)
 
         # Clean up multiple spaces
-        result = re.sub(r'\s+', ' ', result).strip()
+        result = _WHITESPACE_RE.sub(' ', result).strip()
 
         return result
 
-    def detect_signals(self, text: str) -> Dict[str, bool]:
-        """Detect which semantic signals are present in the text."""
-        text_lower = text.lower()
-        return {
-            'request': any(s in text_lower for s in self.REQUEST_SIGNALS),
-            'repetition': any(s in text_lower for s in self.REPETITION_SIGNALS),
-            'success': any(s in text_lower for s in self.SUCCESS_SIGNALS),
-            'failure': any(s in text_lower for s in self.FAILURE_SIGNALS),
-            'learning': any(s in text_lower for s in self.LEARNING_SIGNALS),
-            'best_practice': any(s in text_lower for s in self.BEST_PRACTICE_SIGNALS),
-            'emphasis': any(s in text_lower for s in self.EMPHASIS_SIGNALS),
-        }
-
-    def calculate_importance(self, text: str) -> int:
+    def detect_signals(self, text: str, text_lower: str = None) -> Dict[str, bool]:
+        """Detect which semantic signals are present in the text.
+
+        Uses a single Aho-Corasick pass when pyahocorasick is installed,
+        stopping as soon as every category has been seen.
+
+        Args:
+            text: The text to analyze
+            text_lower: Optional precomputed text.lower(), to avoid recomputing it
+        """
+        if text_lower is None:
+            text_lower = self._lower(text)
+        if self._SIGNAL_AUTOMATON is None:
+            return {
+                category: any(s in text_lower for s in signals)
+                for category, signals in self.SIGNAL_CATEGORIES.items()
+            }
+
+        found = dict.fromkeys(self.SIGNAL_CATEGORIES, False)
+        remaining = len(found)
+        for _, categories in self._SIGNAL_AUTOMATON.iter(text_lower):
+            for category in categories:
+                if not found[category]:
+                    found[category] = True
+                    remaining -= 1
+            if not remaining:
+                break
+        return found
+
+    def calculate_importance(self, text: str, text_lower: str = None) -> int:
         """Calculate importance score (0-10) based on signals present.
 
         Now includes adaptive learning: user-specific emphasized words
         boost the importance score.
+
+        Args:
+            text: The text to score
+            text_lower: Optional precomputed text.lower(), to avoid recomputing it
         """
-        signals = self.detect_signals(text)
+        if text_lower is None:
+            text_lower = self._lower(text)
+        signals = self.detect_signals(text, text_lower)
         score = 0
 
         # High importance signals
@@ -404,71 +843,39 @@ class MemoryExtractor:
         if signals['best_practice']:
             score += 1  # Worth following
 
-        # Adaptive learning boost: check for learned signal words
-        if self.bm:
-            words = text.lower().split()
-            for word in words:
-                word = re.sub(r'[^\w]', '', word)
-                learned_score = self.bm.get_signal_score(word)
+        # Adaptive learning boost: check for learned signal words,
+        # looking each distinct word up once. Boosts only add, so skip
+        # the lookups once the score is already at the cap.
+        if self.bm and score < 10:
+            word_counts = Counter(word for _, word in self._tokenize(text_lower))
+            learned_scores = self.bm.get_signal_scores(word_counts)
+            for word, count in word_counts.items():
+                learned_score = learned_scores[word]
                 if learned_score > 0:
-                    score += min(learned_score, 2)  # Cap per-word boost
+                    score += min(learned_score, 2) * count  # Cap per-word boost
+                    if score >= 10:
+                        break
 
         return min(score, 10)
 
     def _is_garbage_content(self, text: str) -> bool:
         """Check if text is garbage (raw JSON, API responses, template text, etc.)."""
-        garbage_markers = [
-            # Raw API response fragments
-            "{'model':", "'type': 'msg'", "'role': 'assistant'",
-            '"model":', '"type": "message"', '"role": "assistant"',
-            'claude-opus', 'claude-sonnet', 'claude-haiku',
-            'msg_01', '{"id":', 'noreply@anthropic',
-            'stop_reason', 'stop_sequence', 'input_tokens',
-            'cache_creation_input_tokens', 'cache_read_input_tokens',
-            'tool_use_id', 'tool_result', 'output_tokens',
-
-            # Template text from CLAUDE.md (should never be stored as memory)
-            'MEMBERBERRIES CONTEXT', 'Auto-managed, do not edit',
-            'END MEMBERBERRIES', 'How to use this context:',
-            'Pinned = Protected info', 'High Gravity = Frequently',
-            'Active Task = Current focus', 'Memories ranked by importance',
-
-            # System reminder content (should never be extracted)
-            '<system-reminder>', '</system-reminder>',
-            'persisted-output', 'function_results',
-            'system-reminder>',
-            'analyze existing code, write reports',
-            'MUST refuse to improve or augment',
-            'should consider whether it would be considered malware',
-
-            # Memberberries' own template/placeholder text
-            'User need:', 'Repeated issue:', 'General solution',
-            '(Captured from conversation', '(Auto-captured',
-            '(Claude-authored memory)', '(pending resolution)',
-            'pending resolution)',
-
-            # Tool/internal markers
-            'antml:invoke', 'antml:parameter',
-            '<function_results>', '</function_results>',
-
-            # Malformed JSON/data fragments
-            '}}], ', "[{'", "'}]", '}], ', "': [{'",
-            "'content': [{'", '"content": [{"',
-        ]
-
         # Check for explicit markers
-        for marker in garbage_markers:
-            if marker in text:
+        if self._GARBAGE_AUTOMATON is None:
+            if any(marker in text for marker in self.GARBAGE_MARKERS):
                 return True
+        else:
+            for _ in self._GARBAGE_AUTOMATON.iter(text):
+                return True  # First hit is enough
 
         # Check for line number patterns (captured stack traces)
         # Pattern: digits followed by arrow (e.g., "1380→")
-        if re.search(r'\d{2,}→', text):
+        if '→' in text and _LINE_NUMBER_RE.search(text):
             return True
 
         # Check for excessive special characters (likely JSON/code dump)
         if len(text) > 20:
-            special_chars = sum(1 for c in text if c in '{}[]"\':,')
+            special_chars = len(text) - len(text.translate(_SPECIAL_CHARS_TABLE))
             special_ratio = special_chars / len(text)
             if special_ratio > 0.15:
                 return True
@@ -478,47 +885,36 @@ class MemoryExtractor:
     def extract_user_needs(self, text: str) -> List[Dict]:
         """Extract user needs/requests from 'please' and request patterns."""
         needs = []
-        text_lower = text.lower()
+        importance = None  # Scored once for the whole text, on first match
 
         # Look for request patterns
-        request_patterns = [
-            r"(?:please|help me|can you|could you)\s+([^.?!]+)[.?!]?",
-            r"(?:i need|i want|trying to)\s+([^.?!]+)[.?!]?",
-            r"(?:how do i|how can i)\s+([^.?!]+)\??",
-        ]
-
-        for pattern in request_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _REQUEST_RES:
+            for match in pattern.finditer(text):
                 need = match.group(1).strip()
                 # Skip garbage content and too-short matches
                 if len(need) > 10 and not self._is_garbage_content(need):
                     # Smart truncation: preserve complete sentences/phrases
                     truncated = self._smart_truncate(need, max_len=500)
+                    if importance is None:
+                        importance = self.calculate_importance(text)
                     needs.append({
                         'type': 'user_need',
                         'need': truncated,
                         'tags': self.extract_tags(need),
-                        'importance': self.calculate_importance(text)
+                        'importance': importance
                     })
+                    if len(needs) == 3:
+                        return needs
 
-        return needs[:3]
+        return needs
 
     def extract_forgotten_items(self, text: str) -> List[Dict]:
         """Extract things that were repeated (should have been remembered)."""
         forgotten = []
-        text_lower = text.lower()
 
         # Look for repetition indicators
-        repetition_patterns = [
-            r"(?:again|still|keep getting|keeps happening)\s*[,:]?\s*([^.!?]+)[.!?]?",
-            r"(?:same|recurring)\s+(?:issue|problem|error)[:\s]+([^.!?]+)[.!?]?",
-            r"(?:as i mentioned|like before)[,:]?\s*([^.!?]+)[.!?]?",
-        ]
-
-        for pattern in repetition_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _REPETITION_RES:
+            for match in pattern.finditer(text):
                 item = match.group(1).strip()
                 # Skip garbage content
                 if len(item) > 10 and not self._is_garbage_content(item):
@@ -530,8 +926,10 @@ class MemoryExtractor:
                         'tags': self.extract_tags(item),
                         'importance': 10  # High priority - should have been remembered!
                     })
+                    if len(forgotten) == 2:
+                        return forgotten
 
-        return forgotten[:2]
+        return forgotten
 
     def extract_claude_decisions(self, text: str) -> List[Dict]:
         """Extract decisions and reasoning from Claude's responses.
@@ -540,8 +938,8 @@ class MemoryExtractor:
         """
         decisions = []
 
-        for pattern in self.DECISION_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in self._DECISION_RES:
+            matches = pattern.finditer(text)
             for match in matches:
                 decision = match.group(1).strip()
                 if len(decision) > 15 and not self._is_garbage_content(decision):
@@ -557,13 +955,15 @@ class MemoryExtractor:
                         'tags': self.extract_tags(decision),
                         'importance': 7  # Decisions are high value
                     })
+                    if len(decisions) == 3:
+                        return decisions
 
         return decisions[:3]
 
     def _extract_reasoning(self, context: str) -> Optional[str]:
         """Extract reasoning from context following a decision."""
-        for pattern in self.REASONING_PATTERNS:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern in self._REASONING_RES:
+            match = pattern.search(context)
             if match:
                 return match.group(1).strip()
         return None
@@ -572,8 +972,8 @@ class MemoryExtractor:
         """Extract summaries and key points from Claude's responses."""
         summaries = []
 
-        for pattern in self.SUMMARY_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in self._SUMMARY_RES:
+            matches = pattern.finditer(text)
             for match in matches:
                 summary = match.group(1).strip()
                 if len(summary) > 20 and not self._is_garbage_content(summary):
@@ -583,6 +983,8 @@ class MemoryExtractor:
                         'tags': self.extract_tags(summary),
                         'importance': 6
                     })
+                    if len(summaries) == 2:
+                        return summaries
 
         return summaries[:2]
 
@@ -591,8 +993,7 @@ class MemoryExtractor:
         code_decisions = []
 
         # Look for code blocks with preceding context
-        code_pattern = r"([^\n]+)\n```(\w+)\n([\s\S]+?)```"
-        matches = re.finditer(code_pattern, text)
+        matches = _CODE_BLOCK_RE.finditer(text)
 
         for match in matches:
             context = match.group(1).strip()
@@ -607,9 +1008,11 @@ class MemoryExtractor:
                         'context': self._smart_truncate(context, max_len=200),
                         'language': language,
                         'code': self._smart_truncate(code, max_len=500),
-                        'tags': self.extract_tags(context) + [language],
+                        'tags': self.extract_tags(context, extra=(language,)),
                         'importance': 6
                     })
+                    if len(code_decisions) == 3:
+                        break
 
         return code_decisions[:3]
 
@@ -618,15 +1021,9 @@ class MemoryExtractor:
         confirmed = []
 
         # Look for success + solution patterns
-        success_patterns = [
-            r"(?:that worked|works now|fixed it|solved)[.!]?\s*([^.!?]*(?:by|with|using)[^.!?]+)[.!?]?",
-            r"(?:perfect|exactly what i needed)[.!]?\s*([^.!?]+)[.!?]?",
-        ]
-
-        for pattern in success_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                solution = match.group(1).strip() if match.groups() else ""
+        for pattern in _SUCCESS_RES:
+            for match in pattern.finditer(text):
+                solution = match.group(1).strip()
                 if len(solution) > 10:
                     # Larger limit for confirmed solutions - they're valuable
                     truncated = self._smart_truncate(solution, max_len=800)
@@ -636,28 +1033,56 @@ class MemoryExtractor:
                         'tags': self.extract_tags(solution),
                         'importance': 8  # High value - confirmed working
                     })
+                    if len(confirmed) == 2:
+                        return confirmed
 
-        return confirmed[:2]
+        return confirmed
 
-    def extract_tags(self, text: str) -> List[str]:
-        """Extract relevant tags from text based on keywords."""
-        text_lower = text.lower()
-        tags = set()
+    def extract_tags(self, text: str, extra: Tuple[str, ...] = ()) -> List[str]:
+        """Extract relevant tags from text based on keywords.
 
-        for tag, keywords in self.TECH_KEYWORDS.items():
-            if any(kw in text_lower for kw in keywords):
-                tags.add(tag)
+        Args:
+            text: The text to tag
+            extra: Tags to append after the keyword tags, skipping duplicates
+        """
+        tags = list(self._match_tags(text))
+        tags.extend(tag for tag in extra if tag not in tags)
+        return tags
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _match_tags(cls, text: str) -> Tuple[str, ...]:
+        """Match TECH_KEYWORDS against text, case-insensitively.
+
+        Memoized on the text as given, because extractors tag the same
+        snippets repeatedly (e.g. one need and its parent message); a cache
+        hit skips lowercasing as well as matching. Uses a single Aho-Corasick
+        pass over a tag bitmask when available, decoded by table lookup.
+        Tags come back in TECH_KEYWORDS order.
+        """
+        text_lower = text.lower()
+        if cls._TAG_AUTOMATON is None:
+            return tuple(
+                tag for tag, keywords in cls.TECH_KEYWORDS.items()
+                if any(kw in text_lower for kw in keywords)
+            )[:5]  # Limit to 5 tags
+
+        mask = 0
+        all_tags = len(cls._TAG_TABLE) - 1
+        for _, bits in cls._TAG_AUTOMATON.iter(text_lower):
+            mask |= bits
+            if mask == all_tags:
+                break
 
-        return list(tags)[:5]  # Limit to 5 tags
+        return cls._TAG_TABLE[mask]
 
     def extract_solutions(self, text: str) -> List[Dict]:
         """Extract solution patterns from text."""
         solutions = []
 
-        for pattern in self.SOLUTION_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                solution_text = match.group(1).strip() if match.groups() else match.group(0).strip()
+        for pattern, folded in zip(self._SOLUTION_RES, self._SOLUTION_FOLDED):
+            for match in self._finditer(pattern, folded, text):
+                solution_text = text[match.start(1):match.end(1)].strip()
                 if len(solution_text) > 20:  # Filter out too short matches
                     # Try to find context (what problem this solves)
                     context_start = max(0, match.start() - 300)
@@ -674,8 +1099,10 @@ class MemoryExtractor:
                         'solution': solution_truncated,
                         'tags': self.extract_tags(text[context_start:match.end()])
                     })
+                    if len(solutions) == 3:
+                        return solutions
 
-        return solutions[:3]  # Limit to prevent spam
+        return solutions
 
     def extract_error_patterns(self, text: str) -> List[Dict]:
         """Extract error patterns and their resolutions.
@@ -688,22 +1115,15 @@ class MemoryExtractor:
         errors = []
 
         # First, try to extract structured error+resolution pairs
-        structured_patterns = [
-            # "Error: X → Fix: Y" or "Error: X - Resolution: Y"
-            r"(?:error|issue|problem):\s*([^→\-\n]+)(?:→|\s*-\s*)(?:fix|solution|resolution):\s*([^\n]+)",
-            # "Fixed X by Y" or "Resolved X by Y"
-            r"(?:fixed|resolved|solved)\s+(?:the\s+)?([^.]+?)\s+by\s+([^.]+)",
-            # "X was caused by Y" (error is X, resolution context is Y)
-            r"([^.]+?)\s+(?:was\s+)?(?:caused\s+by|due\s+to)\s+([^.]+)",
-            # "The solution to X is Y"
-            r"(?:the\s+)?solution\s+to\s+([^.]+?)\s+is\s+([^.]+)",
-        ]
-
-        for pattern in structured_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern, folded, tail in zip(_STRUCTURED_ERROR_RES, _STRUCTURED_ERROR_FOLDED,
+                                         _STRUCTURED_ERROR_TAILS):
+            if tail is None:
+                matches = self._finditer(pattern, folded, text)
+            else:
+                matches = _finditer_clauses(pattern, tail, text)
             for match in matches:
-                error_desc = match.group(1).strip()
-                resolution = match.group(2).strip()
+                error_desc = text[match.start(1):match.end(1)].strip()
+                resolution = text[match.start(2):match.end(2)].strip()
 
                 # Validate: both parts should be meaningful
                 if (len(error_desc) > 10 and len(resolution) > 10 and
@@ -716,13 +1136,14 @@ class MemoryExtractor:
                         'tags': self.extract_tags(error_desc + " " + resolution),
                         'structured': True
                     })
+                    if len(errors) == 2:
+                        return errors
 
         # If no structured patterns found, fall back to original method
         if not errors:
-            for pattern in self.ERROR_PATTERNS:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    error_msg = match.group(1).strip() if match.groups() else match.group(0).strip()
+            for pattern, folded in zip(self._ERROR_RES, self._ERROR_FOLDED):
+                for match in self._finditer(pattern, folded, text):
+                    error_msg = text[match.start(1):match.end(1)].strip()
 
                     # Skip garbage content (raw stack traces, etc.)
                     if self._is_garbage_content(error_msg):
@@ -742,17 +1163,18 @@ class MemoryExtractor:
                             'resolution': resolution_truncated,
                             'tags': self.extract_tags(error_msg + " " + resolution)
                         })
+                        if len(errors) == 2:
+                            return errors
 
-        return errors[:2]  # Limit
+        return errors
 
     def extract_antipatterns(self, text: str) -> List[Dict]:
         """Extract antipatterns from text."""
         antipatterns = []
 
-        for pattern in self.ANTIPATTERN_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                bad_pattern = match.group(1).strip()
+        for pattern, folded in zip(self._ANTIPATTERN_RES, self._ANTIPATTERN_FOLDED):
+            for match in self._finditer(pattern, folded, text):
+                bad_pattern = text[match.start(1):match.end(1)].strip()
 
                 # Look for the reason and alternative
                 context = text[match.start():match.end() + 500]
@@ -770,43 +1192,45 @@ class MemoryExtractor:
                         'alternative': alt_truncated,
                         'tags': self.extract_tags(context)
                     })
+                    if len(antipatterns) == 2:
+                        return antipatterns
 
-        return antipatterns[:2]  # Limit
+        return antipatterns
 
     def _extract_problem(self, context: str) -> Optional[str]:
         """Try to extract a problem description from context."""
         # Look for question patterns
-        question_match = re.search(r'(?:how (?:do|can|to)|what|why|when)[^?]*\?', context, re.IGNORECASE)
+        question_match = '?' in context and next(_fold_finditer(_QUESTION_RE, _QUESTION_FOLDED, context), None)
         if question_match:
-            return question_match.group(0).strip()
+            return context[question_match.start():question_match.end()].strip()
 
         # Look for "I need to" or "trying to" patterns
-        need_match = re.search(r'(?:i need to|trying to|want to|need help with)([^.]+)', context, re.IGNORECASE)
+        need_match = next(_fold_finditer(_NEED_RE, _NEED_FOLDED, context, literals=_NEED_LITERALS), None)
         if need_match:
-            return need_match.group(1).strip()
+            return context[need_match.start(1):need_match.end(1)].strip()
 
         return None
 
     def _extract_resolution(self, text: str) -> Optional[str]:
         """Extract resolution from text following an error."""
         # Look for fix/solution indicators
-        fix_match = re.search(r'(?:to fix|solution|resolve|try|use|change|update|install)([^.]+\.)', text, re.IGNORECASE)
+        fix_match = next(_fold_finditer(_FIX_RE, _FIX_FOLDED, text), None)
         if fix_match:
-            return fix_match.group(0).strip()
+            return text[fix_match.start():fix_match.end()].strip()
         return None
 
     def _extract_reason(self, text: str) -> Optional[str]:
         """Extract reason from antipattern context."""
-        reason_match = re.search(r'(?:because|since|as it|this causes|leads to|results in)([^.]+)', text, re.IGNORECASE)
+        reason_match = next(_fold_finditer(_REASON_RE, _REASON_FOLDED, text, literals=_REASON_LITERALS), None)
         if reason_match:
-            return reason_match.group(1).strip()
+            return text[reason_match.start(1):reason_match.end(1)].strip()
         return None
 
     def _extract_alternative(self, text: str) -> Optional[str]:
         """Extract alternative from antipattern context."""
-        alt_match = re.search(r'(?:instead|use|try|prefer|better to|should)([^.]+)', text, re.IGNORECASE)
+        alt_match = next(_fold_finditer(_ALT_RE, _ALT_FOLDED, text), None)
         if alt_match:
-            return alt_match.group(1).strip()
+            return text[alt_match.start(1):alt_match.end(1)].strip()
         return None
 
     def extract_memory_refinements(self, text: str) -> List[Dict]:
@@ -821,15 +1245,8 @@ class MemoryExtractor:
         """
         refinements = []
 
-        # Pattern: memberberry refine <id>: <summary>
-        patterns = [
-            r"memberberry\s+refine\s+([a-f0-9]{6,12}):\s*(.+?)(?:\n|$)",
-            r"refine\s+memory\s+([a-f0-9]{6,12}):\s*(.+?)(?:\n|$)",
-            r"`([a-f0-9]{6,12})`\s*(?:should be|better as|refine to):\s*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _REFINEMENT_RES:
+            matches = pattern.finditer(text)
             for match in matches:
                 memory_id = match.group(1).strip()
                 new_summary = match.group(2).strip()
@@ -852,24 +1269,30 @@ class MemoryExtractor:
             is_assistant: If True, prioritize Claude-response-specific patterns
         """
         memories = []
+        extractors = []
 
         # === CLAUDE RESPONSE EXTRACTION (highest priority) ===
         if is_assistant:
-            memories.extend(self.extract_claude_decisions(text))
-            memories.extend(self.extract_claude_summaries(text))
-            memories.extend(self.extract_code_decisions(text))
-            # Check for memory refinements from Claude
-            memories.extend(self.extract_memory_refinements(text))
-
-        # Signal-based extractions (high priority)
-        memories.extend(self.extract_forgotten_items(text))      # "again" - must remember!
-        memories.extend(self.extract_confirmed_solutions(text))  # "that worked" - high value
-        memories.extend(self.extract_user_needs(text))           # "please" - user's goals
-
-        # Pattern-based extractions
-        memories.extend(self.extract_solutions(text))
-        memories.extend(self.extract_error_patterns(text))
-        memories.extend(self.extract_antipatterns(text))
+            extractors += [
+                self.extract_claude_decisions,
+                self.extract_claude_summaries,
+                self.extract_code_decisions,
+                # Check for memory refinements from Claude
+                self.extract_memory_refinements,
+            ]
+
+        extractors += [
+            # Signal-based extractions (high priority)
+            self.extract_forgotten_items,      # "again" - must remember!
+            self.extract_confirmed_solutions,  # "that worked" - high value
+            self.extract_user_needs,           # "please" - user's goals
+            # Pattern-based extractions
+            self.extract_solutions,
+            self.extract_error_patterns,
+            self.extract_antipatterns,
+        ]
+        for extractor in extractors:
+            memories.extend(extractor(text))
 
         # Sort by importance (highest first)
         memories.sort(key=lambda m: m.get('importance', 0), reverse=True)
@@ -877,17 +1300,95 @@ class MemoryExtractor:
         return memories
 
 
+def _extract_text_from_messages(messages: List[Dict]) -> Tuple[str, str]:
+    """Extract text content from message objects, separating user and assistant.
+
+    Returns:
+        Tuple of (user_text, assistant_text)
+    """
+    user_texts = []
+    assistant_texts = []
+
+    for msg in messages:
+        if isinstance(msg, dict):
+            role = msg.get('role', 'user')
+            content_text = ""
+
+            # Try common message structures
+            if 'content' in msg:
+                content = msg['content']
+                reader = _CONTENT_READERS.get(type(content))
+                if reader:
+                    content_text = reader(content)
+            elif 'text' in msg:
+                content_text = msg['text']
+            elif 'message' in msg:
+                content_text = str(msg['message'])
+
+            # Sort by role
+            if role == 'assistant':
+                assistant_texts.append(content_text)
+            else:
+                user_texts.append(content_text)
+
+    return "\n\n".join(user_texts), "\n\n".join(assistant_texts)
+
+
+def _read_transcript(transcript_path: str, last_n_messages: int) -> Optional[Tuple[str, str]]:
+    """Read the last N messages of a transcript as (user_text, assistant_text).
+
+    Returns None if the transcript is missing or unreadable.
+    """
+    transcript_path = Path(transcript_path)
+    if not transcript_path.exists():
+        return None
+
+    # Read the transcript (JSONL format), keeping only the last N messages
+    try:
+        recent_messages = [
+            _json_loads(line) for line in _read_last_lines(transcript_path, last_n_messages)
+        ]
+    except Exception:
+        return None
+
+    # Extract text content from messages, separated by role
+    return _extract_text_from_messages(recent_messages)
+
+
+def _extract_from_texts(extractor: MemoryExtractor, user_text: str,
+                        assistant_text: str) -> List[Dict]:
+    """Extract memories from both sides of a conversation."""
+    extracted = []
+
+    # Extract from user messages (standard patterns)
+    if user_text:
+        extracted.extend(extractor.extract_all(user_text, is_assistant=False))
+
+    # Extract from assistant messages (Claude-specific patterns)
+    if assistant_text:
+        extracted.extend(extractor.extract_all(assistant_text, is_assistant=True))
+
+    return extracted
+
+
 class AutoConcentrator:
     """Automatically concentrates memories from conversations.
 
     Includes adaptive learning to improve memory extraction over time.
     """
 
+    # How many stored memories to remember when skipping exact repeats
+    RECENT_MEMORY_LIMIT = 1024
+
     def __init__(self, project_path: str = None, storage_mode: str = 'auto'):
+        from berry_manager import BerryManager
+
         self.project_path = Path(project_path) if project_path else Path.cwd()
         self.bm = BerryManager(storage_mode=storage_mode, project_path=str(self.project_path))
         # Pass BerryManager to extractor for adaptive learning
         self.extractor = MemoryExtractor(berry_manager=self.bm)
+        # Keys of memories stored by this instance, oldest first
+        self._recent_memories = OrderedDict()
 
     def process_transcript(self, transcript_path: str, last_n_messages: int = 5) -> List[Dict]:
         """Process a Claude Code transcript file and extract memories.
@@ -901,49 +1402,87 @@ class AutoConcentrator:
         Returns:
             List of extracted and stored memories
         """
-        transcript_path = Path(transcript_path)
-        if not transcript_path.exists():
+        texts = _read_transcript(transcript_path, last_n_messages)
+        if texts is None:
             return []
+        user_text, assistant_text = texts
 
-        # Read the transcript (JSONL format)
-        messages = []
-        try:
-            with open(transcript_path, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        messages.append(json.loads(line))
-        except Exception:
-            return []
+        # Learn from the user's communication patterns
+        emphasized = []
+        if user_text:
+            emphasized = self.extractor.detect_emphasis_patterns(user_text)
+            self.extractor.learn_from_text(user_text, emphasized=emphasized)
 
-        # Get the last N messages
-        recent_messages = messages[-last_n_messages:] if len(messages) > last_n_messages else messages
+        # Extract and store memories
+        extracted = _extract_from_texts(self.extractor, user_text, assistant_text)
+        stored = self._store_memories(extracted)
 
-        # Extract text content from messages, separated by role
-        user_text, assistant_text = self._extract_text_from_messages(recent_messages)
+        # Record effective signals when memories are successfully extracted
+        if stored and user_text:
+            self.bm.record_effective_signals(emphasized[:5])
 
-        # Learn from the user's communication patterns
-        if user_text:
-            self.extractor.learn_from_text(user_text)
+        return stored
 
-        # Extract memories from both sources
-        extracted = []
+    def concentrate_many(self, transcript_paths: List[str], last_n_messages: int = 5,
+                         max_workers: int = None) -> List[Dict]:
+        """Process many transcripts, extracting from them in parallel.
 
-        # Extract from user messages (standard patterns)
-        if user_text:
-            extracted.extend(self.extractor.extract_all(user_text, is_assistant=False))
+        Extraction is CPU-bound regex work, so it runs in a process pool.
+        Workers score against a snapshot of the learned signals and never
+        touch the berry index. Learning and storage stay in this process,
+        transcript by transcript in the order given, inside one batch so
+        the index is saved once. Unlike calling process_transcript() in a
+        loop, every transcript is scored against the learned signals as
+        they were at the start.
 
-        # Extract from assistant messages (Claude-specific patterns)
-        if assistant_text:
-            extracted.extend(self.extractor.extract_all(assistant_text, is_assistant=True))
+        Args:
+            transcript_paths: Paths to .jsonl transcript files
+            last_n_messages: Number of recent messages to analyze per transcript
+            max_workers: Worker processes (defaults to the CPU count)
 
-        # Store extracted memories
-        stored = self._store_memories(extracted)
+        Returns:
+            List of extracted and stored memories across all transcripts.
+            Storage is all or nothing: if the index cannot be saved, it is
+            rolled back to how it was before the call (learned signals
+            included) and an empty list is returned, so the same transcripts
+            can simply be processed again.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_concentrate_worker,
+            initargs=(self.bm.index.get("learned_signals", {}),)
+        ) as pool:
+            results = list(pool.map(
+                _concentrate_worker,
+                [str(path) for path in transcript_paths],
+                [last_n_messages] * len(transcript_paths)
+            ))
 
-        # Record effective signals when memories are successfully extracted
-        if stored and user_text:
-            emphasized = self.extractor.detect_emphasis_patterns(user_text)
-            for word in emphasized[:5]:
-                self.bm.record_effective_signal(word)
+        stored = []
+        try:
+            with self.bm.batch():
+                for result in results:
+                    if result is None:
+                        continue
+                    user_text, extracted = result
+
+                    emphasized = []
+                    if user_text:
+                        emphasized = self.extractor.detect_emphasis_patterns(user_text)
+                        self.extractor.learn_from_text(user_text, emphasized=emphasized)
+
+                    stored_here = self._store_memories(extracted)
+                    if stored_here and user_text:
+                        self.bm.record_effective_signals(emphasized[:5])
+                    stored.extend(stored_here)
+        except RuntimeError:
+            # The index could not be saved and was rolled back, so nothing
+            # was stored; forget these memories so a retry can store them
+            for memory in stored:
+                self._recent_memories.pop(_memory_key(memory), None)
+            return []
 
         return stored
 
@@ -959,7 +1498,8 @@ class AutoConcentrator:
             List of extracted and stored memories
         """
         # Learn from the user's communication patterns
-        self.extractor.learn_from_text(text)
+        emphasized = self.extractor.detect_emphasis_patterns(text)
+        self.extractor.learn_from_text(text, emphasized=emphasized)
 
         # Extract and store memories
         extracted = self.extractor.extract_all(text)
@@ -967,208 +1507,188 @@ class AutoConcentrator:
 
         # Record effective signals when memories are successfully extracted
         if stored:
-            emphasized = self.extractor.detect_emphasis_patterns(text)
-            for word in emphasized[:5]:  # Limit to top 5
-                self.bm.record_effective_signal(word)
+            self.bm.record_effective_signals(emphasized[:5])  # Limit to top 5
 
         return stored
 
-    def _extract_text_from_messages(self, messages: List[Dict]) -> Tuple[str, str]:
-        """Extract text content from message objects, separating user and assistant.
-
-        Returns:
-            Tuple of (user_text, assistant_text)
-        """
-        user_texts = []
-        assistant_texts = []
-
-        for msg in messages:
-            if isinstance(msg, dict):
-                role = msg.get('role', 'user')
-                content_text = ""
-
-                # Try common message structures
-                if 'content' in msg:
-                    content = msg['content']
-                    if isinstance(content, str):
-                        content_text = content
-                    elif isinstance(content, list):
-                        for item in content:
-                            if isinstance(item, dict) and 'text' in item:
-                                content_text += item['text'] + "\n"
-                            elif isinstance(item, str):
-                                content_text += item + "\n"
-                elif 'text' in msg:
-                    content_text = msg['text']
-                elif 'message' in msg:
-                    content_text = str(msg['message'])
-
-                # Sort by role
-                if role == 'assistant':
-                    assistant_texts.append(content_text)
-                else:
-                    user_texts.append(content_text)
-
-        return "\n\n".join(user_texts), "\n\n".join(assistant_texts)
-
     def _store_memories(self, memories: List[Dict]) -> List[Dict]:
         """Store extracted memories in the berry manager.
 
         Now includes:
         - Auto-pinning of credentials/configs
         - Automatic task clustering based on tags
+        - Dropping near-duplicates found by overlapping extractors
+        - Skipping memories this instance already stored (e.g. from
+          overlapping transcript windows)
         """
+        memories = [
+            memory for memory in _drop_near_duplicates(memories)
+            if _memory_key(memory) not in self._recent_memories
+        ]
         stored = []
 
-        for memory in memories:
-            try:
-                # Check for auto-pin patterns in any memory content
-                content_to_check = ""
-                if memory['type'] == 'solution':
-                    content_to_check = f"{memory['problem']} {memory['solution']}"
-                elif memory['type'] == 'error':
-                    content_to_check = f"{memory['error_message']} {memory['resolution']}"
-                elif memory['type'] == 'confirmed_solution':
-                    content_to_check = memory.get('solution', '')
-
-                # Auto-pin if credentials/configs detected
-                if content_to_check:
-                    pin_result = self.bm.auto_pin_if_needed(
-                        content_to_check,
-                        name_hint=memory.get('problem', memory.get('type', 'Auto-detected'))[:50]
-                    )
-                    if pin_result:
-                        memory['_auto_pinned'] = True
-
-                if memory['type'] == 'solution':
-                    result = self.bm.add_solution(
-                        problem=memory['problem'],
-                        solution=memory['solution'],
-                        tags=memory.get('tags', []),
-                        code_snippet=None
-                    )
-                    # Auto-cluster based on tags
-                    if result and result.get('id'):
-                        self.bm.auto_cluster_memory(
-                            result['id'],
-                            memory.get('tags', []),
-                            f"{memory['problem']} {memory['solution']}"
-                        )
-                    stored.append(memory)
-
-                elif memory['type'] == 'error':
-                    self.bm.add_error(
-                        error_message=memory['error_message'],
-                        resolution=memory['resolution'],
-                        context="Auto-extracted from conversation",
-                        tags=memory.get('tags', [])
-                    )
-                    stored.append(memory)
-
-                elif memory['type'] == 'antipattern':
-                    self.bm.add_antipattern(
-                        pattern=memory['pattern'],
-                        reason=memory['reason'],
-                        alternative=memory['alternative'],
-                        tags=memory.get('tags', [])
-                    )
-                    stored.append(memory)
-
-                elif memory['type'] == 'user_need':
-                    # Store user needs as solutions (what they're trying to accomplish)
-                    self.bm.add_solution(
-                        problem=f"User need: {memory['need']}",
-                        solution="(Captured from conversation - pending resolution)",
-                        tags=memory.get('tags', []) + ['user-need'],
-                        code_snippet=None
-                    )
-                    stored.append(memory)
-
-                elif memory['type'] == 'forgotten_item':
-                    # High priority - this was repeated, should be remembered!
-                    self.bm.add_solution(
-                        problem=f"Repeated issue: {memory['description']}",
-                        solution="(Auto-captured - user had to repeat this)",
-                        tags=memory.get('tags', []) + ['repeated', 'high-priority'],
-                        code_snippet=None
-                    )
-                    stored.append(memory)
-
-                elif memory['type'] == 'confirmed_solution':
-                    # Confirmed working - high value!
-                    self.bm.add_solution(
-                        problem="Confirmed working solution",
-                        solution=memory['solution'],
-                        tags=memory.get('tags', []) + ['confirmed', 'working'],
-                        code_snippet=None
-                    )
-                    stored.append(memory)
-
-                # === CLAUDE RESPONSE TYPES ===
-                elif memory['type'] == 'decision':
-                    # Claude's decisions with reasoning
-                    reasoning = memory.get('reasoning', '')
-                    solution_text = memory['decision']
-                    if reasoning:
-                        solution_text += f" (Reason: {reasoning})"
-                    result = self.bm.add_solution(
-                        problem="Decision",
-                        solution=solution_text,
-                        tags=memory.get('tags', []) + ['decision', 'claude-response'],
-                        code_snippet=None
-                    )
-                    if result and result.get('id'):
-                        self.bm.auto_cluster_memory(
-                            result['id'],
-                            memory.get('tags', []) + ['decision'],
-                            solution_text
-                        )
-                    stored.append(memory)
-
-                elif memory['type'] == 'summary':
-                    # Claude's summaries
-                    result = self.bm.add_solution(
-                        problem="Summary",
-                        solution=memory['content'],
-                        tags=memory.get('tags', []) + ['summary', 'claude-response'],
-                        code_snippet=None
-                    )
-                    if result and result.get('id'):
-                        self.bm.auto_cluster_memory(
-                            result['id'],
-                            memory.get('tags', []) + ['summary'],
-                            memory['content']
-                        )
-                    stored.append(memory)
-
-                elif memory['type'] == 'code_decision':
-                    # Code with context
-                    result = self.bm.add_solution(
-                        problem=memory['context'],
-                        solution=f"[{memory['language']}] code implementation",
-                        tags=memory.get('tags', []) + ['code', 'claude-response'],
-                        code_snippet=memory['code']
-                    )
-                    if result and result.get('id'):
-                        self.bm.auto_cluster_memory(
-                            result['id'],
-                            memory.get('tags', []),
-                            memory['context']
-                        )
-                    stored.append(memory)
-
-                elif memory['type'] == 'refinement':
-                    # Apply memory refinement from Claude's self-reflection
-                    memory_id = memory.get('memory_id', '')
-                    new_content = memory.get('new_content', '')
-                    if memory_id and new_content:
-                        success = self.bm.refine_memory(memory_id, new_content)
-                        if success:
+        # One index save for the whole set instead of one per memory
+        try:
+            with self.bm.batch():
+                for memory in memories:
+                    try:
+                        # Check for auto-pin patterns in any memory content
+                        content_to_check = ""
+                        if memory['type'] == 'solution':
+                            content_to_check = f"{memory['problem']} {memory['solution']}"
+                        elif memory['type'] == 'error':
+                            content_to_check = f"{memory['error_message']} {memory['resolution']}"
+                        elif memory['type'] == 'confirmed_solution':
+                            content_to_check = memory.get('solution', '')
+
+                        # Auto-pin if credentials/configs detected
+                        if content_to_check:
+                            pin_result = self.bm.auto_pin_if_needed(
+                                content_to_check,
+                                name_hint=memory.get('problem', memory.get('type', 'Auto-detected'))[:50]
+                            )
+                            if pin_result:
+                                memory['_auto_pinned'] = True
+
+                        if memory['type'] == 'solution':
+                            result = self.bm.add_solution(
+                                problem=memory['problem'],
+                                solution=memory['solution'],
+                                tags=memory.get('tags', []),
+                                code_snippet=None
+                            )
+                            # Auto-cluster based on tags
+                            if result and result.get('id'):
+                                self.bm.auto_cluster_memory(
+                                    result['id'],
+                                    memory.get('tags', []),
+                                    f"{memory['problem']} {memory['solution']}"
+                                )
                             stored.append(memory)
 
-            except Exception as e:
-                # Silently skip failed extractions
-                pass
+                        elif memory['type'] == 'error':
+                            self.bm.add_error(
+                                error_message=memory['error_message'],
+                                resolution=memory['resolution'],
+                                context="Auto-extracted from conversation",
+                                tags=memory.get('tags', [])
+                            )
+                            stored.append(memory)
+
+                        elif memory['type'] == 'antipattern':
+                            self.bm.add_antipattern(
+                                pattern=memory['pattern'],
+                                reason=memory['reason'],
+                                alternative=memory['alternative'],
+                                tags=memory.get('tags', [])
+                            )
+                            stored.append(memory)
+
+                        elif memory['type'] == 'user_need':
+                            # Store user needs as solutions (what they're trying to accomplish)
+                            self.bm.add_solution(
+                                problem=f"User need: {memory['need']}",
+                                solution="(Captured from conversation - pending resolution)",
+                                tags=memory.get('tags', []) + ['user-need'],
+                                code_snippet=None
+                            )
+                            stored.append(memory)
+
+                        elif memory['type'] == 'forgotten_item':
+                            # High priority - this was repeated, should be remembered!
+                            self.bm.add_solution(
+                                problem=f"Repeated issue: {memory['description']}",
+                                solution="(Auto-captured - user had to repeat this)",
+                                tags=memory.get('tags', []) + ['repeated', 'high-priority'],
+                                code_snippet=None
+                            )
+                            stored.append(memory)
+
+                        elif memory['type'] == 'confirmed_solution':
+                            # Confirmed working - high value!
+                            self.bm.add_solution(
+                                problem="Confirmed working solution",
+                                solution=memory['solution'],
+                                tags=memory.get('tags', []) + ['confirmed', 'working'],
+                                code_snippet=None
+                            )
+                            stored.append(memory)
+
+                        # === CLAUDE RESPONSE TYPES ===
+                        elif memory['type'] == 'decision':
+                            # Claude's decisions with reasoning
+                            reasoning = memory.get('reasoning', '')
+                            solution_text = memory['decision']
+                            if reasoning:
+                                solution_text += f" (Reason: {reasoning})"
+                            result = self.bm.add_solution(
+                                problem="Decision",
+                                solution=solution_text,
+                                tags=memory.get('tags', []) + ['decision', 'claude-response'],
+                                code_snippet=None
+                            )
+                            if result and result.get('id'):
+                                self.bm.auto_cluster_memory(
+                                    result['id'],
+                                    memory.get('tags', []) + ['decision'],
+                                    solution_text
+                                )
+                            stored.append(memory)
+
+                        elif memory['type'] == 'summary':
+                            # Claude's summaries
+                            result = self.bm.add_solution(
+                                problem="Summary",
+                                solution=memory['content'],
+                                tags=memory.get('tags', []) + ['summary', 'claude-response'],
+                                code_snippet=None
+                            )
+                            if result and result.get('id'):
+                                self.bm.auto_cluster_memory(
+                                    result['id'],
+                                    memory.get('tags', []) + ['summary'],
+                                    memory['content']
+                                )
+                            stored.append(memory)
+
+                        elif memory['type'] == 'code_decision':
+                            # Code with context
+                            result = self.bm.add_solution(
+                                problem=memory['context'],
+                                solution=f"[{memory['language']}] code implementation",
+                                tags=memory.get('tags', []) + ['code', 'claude-response'],
+                                code_snippet=memory['code']
+                            )
+                            if result and result.get('id'):
+                                self.bm.auto_cluster_memory(
+                                    result['id'],
+                                    memory.get('tags', []),
+                                    memory['context']
+                                )
+                            stored.append(memory)
+
+                        elif memory['type'] == 'refinement':
+                            # Apply memory refinement from Claude's self-reflection
+                            memory_id = memory.get('memory_id', '')
+                            new_content = memory.get('new_content', '')
+                            if memory_id and new_content:
+                                success = self.bm.refine_memory(memory_id, new_content)
+                                if success:
+                                    stored.append(memory)
+
+                    except Exception as e:
+                        # Silently skip failed extractions
+                        pass
+        except RuntimeError:
+            # The index could not be saved and was rolled back, so nothing was stored
+            return []
+
+        for memory in stored:
+            key = _memory_key(memory)
+            if key is not None:
+                self._recent_memories[key] = None
+        while len(self._recent_memories) > self.RECENT_MEMORY_LIMIT:
+            self._recent_memories.popitem(last=False)
 
         return stored
 
@@ -1184,16 +1704,15 @@ class AutoConcentrator:
         Returns:
             List of memory dicts ready to be stored
         """
-        pattern = r'\[MEMORY\s+((?:#\w+\s*)+)\]\s*(.+?)(?:\n|$)'
-        matches = re.finditer(pattern, text, re.IGNORECASE)
+        matches = _fold_finditer(_MEMORY_MARKER_RE, _MEMORY_MARKER_FOLDED, text)
 
         memories = []
         for match in matches:
-            tags_str = match.group(1)
-            summary = match.group(2).strip()
+            tags_str = text[match.start(1):match.end(1)]
+            summary = text[match.start(2):match.end(2)].strip()
 
             # Parse tags from the #tag format
-            tags = re.findall(r'#(\w+)', tags_str)
+            tags = _MARKER_TAG_RE.findall(tags_str)
 
             # Skip if empty summary
             if not summary:
@@ -1222,8 +1741,10 @@ class AutoConcentrator:
         Returns:
             List of memory IDs to archive
         """
-        pattern = r'\[ARCHIVE\s+([a-f0-9]{8})\]'
-        return re.findall(pattern, text, re.IGNORECASE)
+        return [
+            text[match.start(1):match.end(1)]
+            for match in _fold_finditer(_ARCHIVE_MARKER_RE, _ARCHIVE_MARKER_FOLDED, text)
+        ]
 
     def process_memory_markers(self, transcript_path: str) -> Dict[str, int]:
         """Process Claude's memory markers from a transcript.
@@ -1240,60 +1761,202 @@ class AutoConcentrator:
         if not transcript_path.exists():
             return {'memories': 0, 'archives': 0}
 
-        # Read the transcript (JSONL format)
-        messages = []
+        # Read the transcript (JSONL format), keeping only assistant responses
+        # as it streams, so earlier messages are never held in memory
+        assistant_texts = []
         try:
-            with open(transcript_path, 'r') as f:
+            with open(transcript_path, 'rb') as f:
                 for line in f:
-                    if line.strip():
-                        messages.append(json.loads(line))
+                    if not line.strip():
+                        continue
+                    msg = _json_loads(line)
+                    if isinstance(msg, dict) and msg.get('role') == 'assistant':
+                        content = msg.get('content', '')
+                        if isinstance(content, str):
+                            assistant_texts.append(content)
+                        elif isinstance(content, list):
+                            for item in content:
+                                if isinstance(item, dict) and 'text' in item:
+                                    assistant_texts.append(item['text'])
         except Exception:
             return {'memories': 0, 'archives': 0}
 
-        # Extract assistant responses
-        assistant_texts = []
-        for msg in messages:
-            if isinstance(msg, dict) and msg.get('role') == 'assistant':
-                content = msg.get('content', '')
-                if isinstance(content, str):
-                    assistant_texts.append(content)
-                elif isinstance(content, list):
-                    for item in content:
-                        if isinstance(item, dict) and 'text' in item:
-                            assistant_texts.append(item['text'])
-
         full_text = "\n\n".join(assistant_texts)
 
-        # Parse memory markers
         new_memories = self._parse_memory_markers(full_text)
-        stored_count = 0
-        for mem in new_memories:
-            result = self.bm.add_solution(
-                problem=mem['problem'],
-                solution=mem['solution'],
-                tags=mem.get('tags', []) + ['claude-authored'],
-                code_snippet=None
-            )
-            if result:
-                stored_count += 1
-                # Auto-cluster based on tags
-                if result.get('id'):
-                    self.bm.auto_cluster_memory(
-                        result['id'],
-                        mem.get('tags', []),
-                        mem['problem']
-                    )
-
-        # Parse archive markers
         archive_ids = self._parse_archive_markers(full_text)
+        stored_count = 0
         archived_count = 0
-        for mem_id in archive_ids:
-            if self.bm.archive_memory(mem_id):
-                archived_count += 1
+
+        # One index save for all markers instead of one per memory/archive
+        with self.bm.batch():
+            for mem in new_memories:
+                result = self.bm.add_solution(
+                    problem=mem['problem'],
+                    solution=mem['solution'],
+                    tags=mem.get('tags', []) + ['claude-authored'],
+                    code_snippet=None
+                )
+                if result:
+                    stored_count += 1
+                    # Auto-cluster based on tags
+                    if result.get('id'):
+                        self.bm.auto_cluster_memory(
+                            result['id'],
+                            mem.get('tags', []),
+                            mem['problem']
+                        )
+
+            for mem_id in archive_ids:
+                if self.bm.archive_memory(mem_id):
+                    archived_count += 1
 
         return {'memories': stored_count, 'archives': archived_count}
 
 
+# Shared stateless extractor (no adaptive learning), created on first use
+_DEFAULT_EXTRACTOR = None
+
+
+def get_extractor() -> MemoryExtractor:
+    """Return a process-wide MemoryExtractor without a BerryManager.
+
+    For extraction-only callers; AutoConcentrator keeps its own extractor
+    because it is bound to that concentrator's BerryManager.
+    """
+    global _DEFAULT_EXTRACTOR
+    if _DEFAULT_EXTRACTOR is None:
+        _DEFAULT_EXTRACTOR = MemoryExtractor()
+    return _DEFAULT_EXTRACTOR
+
+
+# The field shown as a one-line preview for each memory type in main()
+_PREVIEW_FIELD = {
+    'user_need': 'need',
+    'forgotten_item': 'description',
+    'decision': 'decision',
+    'summary': 'content',
+    'code_decision': 'context',
+    'confirmed_solution': 'solution',
+    'solution': 'problem',
+    'error': 'error_message',
+    'antipattern': 'pattern',
+    'refinement': 'memory_id',
+}
+
+
+# The fields holding each memory type's main content, compared for dedup
+_CONTENT_FIELDS = {
+    'user_need': ('need',),
+    'forgotten_item': ('description',),
+    'decision': ('decision',),
+    'summary': ('content',),
+    'code_decision': ('code',),
+    'confirmed_solution': ('solution',),
+    'solution': ('solution',),
+    'error': ('error_message', 'resolution'),
+    'antipattern': ('pattern',),
+}
+
+
+# Memory type -> the fields that together identify one memory. A fix or an
+# antipattern only repeats an earlier memory if what it applies to does too.
+_KEY_FIELDS = dict(
+    _CONTENT_FIELDS,
+    solution=('problem', 'solution'),
+    antipattern=('pattern', 'reason', 'alternative'),
+)
+
+
+def _memory_key(memory: Dict) -> Optional[int]:
+    """Hash of a memory's type and identifying fields, or None if it has none."""
+    fields = _KEY_FIELDS.get(memory.get('type'))
+    if not fields:
+        return None
+    return hash((memory['type'],) + tuple(str(memory.get(field) or '') for field in fields))
+
+
+def _shingles(text: str, size: int = 5) -> set:
+    """Character n-grams of text, with case and whitespace runs normalized."""
+    text = ' '.join(text.lower().split())
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _drop_near_duplicates(memories: List[Dict], threshold: float = 0.8) -> List[Dict]:
+    """Collapse memories of one type whose main content is nearly the same text.
+
+    Overlapping patterns often fire on one sentence (e.g. a decision that
+    also reads as a summary line, or two error patterns on one message).
+    Memories of the same type whose content shingles have a Jaccard
+    similarity of at least `threshold` are merged, keeping the more
+    important one in the earlier one's place. Different types are never
+    merged, since each carries its own fields (a solution's problem, an
+    error's resolution). Types without a content field (refinements) are
+    always kept.
+    """
+    kept = []  # (shingles or None, memory)
+    for memory in memories:
+        fields = _CONTENT_FIELDS.get(memory.get('type'), ())
+        content = ' '.join(str(memory.get(field) or '') for field in fields).strip()
+        if not content:
+            kept.append((None, memory))
+            continue
+
+        shingles = _shingles(content)
+        for i, (other, kept_memory) in enumerate(kept):
+            if other is None or kept_memory['type'] != memory['type']:
+                continue
+            overlap = len(shingles & other)
+            if overlap and overlap / (len(shingles) + len(other) - overlap) >= threshold:
+                if memory.get('importance', 0) > kept_memory.get('importance', 0):
+                    kept[i] = (shingles, memory)
+                break
+        else:
+            kept.append((shingles, memory))
+
+    return [memory for _, memory in kept]
+
+
+class _LearnedSignals:
+    """Read-only snapshot of learned signals, standing in for a BerryManager.
+
+    concentrate_many workers only score importance, so they get the
+    parent's learned signals instead of a BerryManager of their own.
+    """
+
+    def __init__(self, learned: Dict):
+        self.learned = learned
+
+    def get_signal_scores(self, words) -> Dict[str, int]:
+        from berry_manager import score_learned_signals
+        return score_learned_signals(self.learned, words)
+
+
+# Per-process state for AutoConcentrator.concentrate_many workers
+_worker_extractor = None
+
+
+def _init_concentrate_worker(learned_signals: Dict):
+    """Build one extractor per worker process, scoring with learned_signals."""
+    global _worker_extractor
+    _worker_extractor = MemoryExtractor(berry_manager=_LearnedSignals(learned_signals))
+
+
+def _concentrate_worker(transcript_path: str,
+                        last_n_messages: int) -> Optional[Tuple[str, List[Dict]]]:
+    """Extract (without storing) memories from one transcript in a worker.
+
+    Returns (user_text, extracted), or None if the transcript is unreadable.
+    """
+    texts = _read_transcript(transcript_path, last_n_messages)
+    if texts is None:
+        return None
+    user_text, assistant_text = texts
+    return user_text, _extract_from_texts(_worker_extractor, user_text, assistant_text)
+
+
 def main():
     """CLI for testing auto-concentrate."""
     import argparse
@@ -1306,17 +1969,19 @@ def main():
 
     args = parser.parse_args()
 
-    concentrator = AutoConcentrator(project_path=args.project)
+    # Dry runs only extract, so they never touch storage
+    if not args.dry_run:
+        concentrator = AutoConcentrator(project_path=args.project)
 
     if args.transcript:
         if args.dry_run:
-            extractor = MemoryExtractor()
+            extractor = get_extractor()
             with open(args.transcript, 'r') as f:
                 text = f.read()
             memories = extractor.extract_all(text)
             print(f"Extracted {len(memories)} memories:")
             for m in memories:
-                print(f"  - [{m['type']}] {list(m.values())[1][:50]}...")
+                print(f"  - [{m['type']}] {m.get(_PREVIEW_FIELD.get(m['type'], 'type'), '')[:50]}...")
         else:
             # DEPRECATED: Legacy pattern extraction - disabled to prevent garbage
             # The aggressive regex patterns were extracting system reminders,
@@ -1330,6 +1995,8 @@ def main():
             # This keeps working memory current within the session
             if marker_results['memories'] > 0 or marker_results['archives'] > 0:
                 try:
+                    from member import ClaudeMDManager
+
                     project_path = Path(args.project) if args.project else Path.cwd()
                     manager = ClaudeMDManager(project_path=project_path)
                     manager.sync_claude_md(quiet=True)
@@ -1338,14 +2005,13 @@ def main():
 
     elif args.text:
         if args.dry_run:
-            extractor = MemoryExtractor()
-            memories = extractor.extract_all(args.text)
+            memories = get_extractor().extract_all(args.text)
         else:
             memories = concentrator.process_text(args.text)
 
         print(f"Extracted {len(memories)} memories:")
         for m in memories:
-            print(f"  - [{m['type']}] {list(m.values())[1][:50]}...")
+            print(f"  - [{m['type']}] {m.get(_PREVIEW_FIELD.get(m['type'], 'type'), '')[:50]}...")
 
     else:
         parser.print_help()
@@ -8,9 +8,11 @@ A lightweight berry storage system for persisting and juicing context across ses
 
 import os
 import re
+import copy
 import json
 import hashlib
 import stat
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -40,6 +42,40 @@ SENSITIVE_PATTERNS = [
     (r'credential', 'Credential'),
     (r'auth[_-]?key', 'Auth key'),
 ]
+_SENSITIVE_RES = [
+    (re.compile(pattern, re.IGNORECASE), description)
+    for pattern, description in SENSITIVE_PATTERNS
+]
+
+
+def score_learned_signals(learned: Dict, words) -> Dict[str, int]:
+    """Score words against a "learned_signals" index section.
+
+    Args:
+        learned: The index's "learned_signals" dict
+        words: Iterable of words to score
+
+    Returns:
+        Dict mapping each word (as given) to its score
+    """
+    emphasis = learned.get("emphasis", {})
+    repeated = learned.get("repeated", {})
+    effective = set(learned.get("effective", []))
+
+    scores = {}
+    for word in words:
+        key = word.lower().strip()
+        score = 0
+        # Check emphasis
+        score += emphasis.get(key, 0)
+        # Check repeated
+        score += repeated.get(key, 0) // 2
+        # Bonus if it's proven effective
+        if key in effective:
+            score += 5
+        scores[word] = score
+
+    return scores
 
 
 class BerryManager:
@@ -86,6 +122,10 @@ class BerryManager:
         for path in all_paths:
             path.mkdir(parents=True, exist_ok=True)
 
+        # Index saves deferred by batch(): nesting depth, and whether one is owed
+        self._batch_depth = 0
+        self._batch_dirty = False
+
         # Load or create berry index
         self.index_path = self.base_path / "berry_index.json"
         self.index = self._load_index()
@@ -223,7 +263,13 @@ class BerryManager:
         2. Write to temporary file
         3. Validate the JSON is readable
         4. Atomically rename temp to target
+
+        Inside a batch() block the save is deferred until the block exits.
         """
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+
         import tempfile
         import fcntl
 
@@ -287,6 +333,38 @@ class BerryManager:
                 pass
             raise RuntimeError(f"Failed to save index: {e}")
 
+    @contextmanager
+    def batch(self):
+        """Group several updates into a single index save.
+
+        Every save requested inside the block is deferred, and the index is
+        written once when the outermost block exits (even if it raised).
+        Each save copies a backup, rewrites the whole index and fsyncs, so
+        storing many memories at once is much cheaper inside a batch.
+
+        If that save fails, the in-memory index is rolled back to how it was
+        when the outermost block was entered, and the RuntimeError is raised.
+
+        Example:
+            with bm.batch():
+                bm.add_solution(...)
+                bm.add_error(...)
+        """
+        snapshot = None if self._batch_depth else copy.deepcopy(self.index)
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                try:
+                    self._save_index()
+                except RuntimeError:
+                    # Nothing reached disk, so drop the updates in memory too
+                    self.index = snapshot
+                    raise
+
     def _sanitize_index(self):
         """Sanitize all string content in the index to prevent JSON corruption."""
         def sanitize_string(s):
@@ -370,8 +448,8 @@ class BerryManager:
         detected = []
         text_lower = text.lower()
 
-        for pattern, description in SENSITIVE_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        for pattern, description in _SENSITIVE_RES:
+            if pattern.search(text_lower):
                 if description not in detected:
                     detected.append(description)
 
@@ -1245,17 +1323,32 @@ class BerryManager:
             signal_type: "emphasis" (caps, exclamation) or "repeated" (frequent use)
             weight: How much to boost this signal's score
         """
-        word = word.lower().strip()
-        if not word or len(word) < 3:
-            return
+        self.learn_signals([(word, signal_type, weight)])
+
+    def learn_signals(self, signals: List[Tuple[str, str, int]]):
+        """Learn several signal words at once, saving the index a single time.
 
+        Args:
+            signals: List of (word, signal_type, weight) tuples, as accepted
+                by learn_signal()
+        """
         learned = self.index.get("learned_signals", {})
-        if signal_type not in learned:
-            learned[signal_type] = {}
+        changed = False
+
+        for word, signal_type, weight in signals:
+            word = word.lower().strip()
+            if not word or len(word) < 3:
+                continue
 
-        if signal_type in ["emphasis", "repeated"]:
-            current = learned[signal_type].get(word, 0)
-            learned[signal_type][word] = current + weight
+            if signal_type not in learned:
+                learned[signal_type] = {}
+
+            if signal_type in ["emphasis", "repeated"]:
+                current = learned[signal_type].get(word, 0)
+                learned[signal_type][word] = current + weight
+                changed = True
+
+        if changed:
             self.index["learned_signals"] = learned
             self._save_index()
 
@@ -1264,13 +1357,26 @@ class BerryManager:
 
         This helps identify which signals work best for this user.
         """
-        signal = signal.lower().strip()
+        self.record_effective_signals([signal])
+
+    def record_effective_signals(self, signals: List[str]):
+        """Record several effective signals at once, saving the index a single time.
+
+        Args:
+            signals: Signal words, as accepted by record_effective_signal()
+        """
         learned = self.index.get("learned_signals", {})
         if "effective" not in learned:
             learned["effective"] = []
 
-        if signal not in learned["effective"]:
-            learned["effective"].append(signal)
+        changed = False
+        for signal in signals:
+            signal = signal.lower().strip()
+            if signal not in learned["effective"]:
+                learned["effective"].append(signal)
+                changed = True
+
+        if changed:
             self.index["learned_signals"] = learned
             self._save_index()
 
@@ -1305,19 +1411,18 @@ class BerryManager:
 
         Higher scores mean the user tends to emphasize this word.
         """
-        word = word.lower().strip()
-        learned = self.index.get("learned_signals", {})
+        return self.get_signal_scores([word])[word]
 
-        score = 0
-        # Check emphasis
-        score += learned.get("emphasis", {}).get(word, 0)
-        # Check repeated
-        score += learned.get("repeated", {}).get(word, 0) // 2
-        # Bonus if it's proven effective
-        if word in learned.get("effective", []):
-            score += 5
+    def get_signal_scores(self, words) -> Dict[str, int]:
+        """Get learned importance scores for many words in one call.
+
+        Args:
+            words: Iterable of words to score
 
-        return score
+        Returns:
+            Dict mapping each word (as given) to its score
+        """
+        return score_learned_signals(self.index.get("learned_signals", {}), words)
 
     # AUTO-PIN DETECTION
 
@@ -1337,13 +1442,39 @@ class BerryManager:
         (r'https?://[\w.-]+(?::\d+)?/api/v\d+', 'api', 'API endpoint'),
     ]
 
+    # Lowercase text each AUTO_PIN_PATTERNS entry cannot match without
+    AUTO_PIN_LITERALS = {
+        'SSH connection': '@',
+        'Server address': '@',
+        'IP address': '.',
+        'API key': 'sk-',
+        'GitHub token': 'ghp_',
+        'Private key': '-----begin',
+        'Bearer token': 'bearer',
+        'MongoDB URI': 'mongodb',
+        'PostgreSQL URI': 'postgres',
+        'MySQL URI': 'mysql://',
+        'Redis URI': 'redis://',
+        'API endpoint': '/api/v',
+    }
+    _AUTO_PIN_RES = [
+        (re.compile(pattern, re.IGNORECASE), category, description)
+        for pattern, category, description in AUTO_PIN_PATTERNS
+    ]
+
     def detect_auto_pin(self, text: str) -> Optional[Dict]:
         """Detect if text contains patterns that should be auto-pinned.
 
         Returns pin metadata if pattern detected, None otherwise.
         """
-        for pattern, category, description in self.AUTO_PIN_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        # A pattern whose literal is absent cannot match, so skip its regex.
+        # Only safe for ASCII, where lower() agrees with re.IGNORECASE.
+        text_lower = text.lower() if text.isascii() else None
+
+        for pattern, category, description in self._AUTO_PIN_RES:
+            if text_lower is not None and self.AUTO_PIN_LITERALS[description] not in text_lower:
+                continue
+            match = pattern.search(text)
             if match:
                 return {
                     'category': category,
@@ -0,0 +1,188 @@
+"""Tests for auto_concentrate.py."""
+
+import copy
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from auto_concentrate import (
+    AutoConcentrator, MemoryExtractor, _CAUSE_TAIL_RE, _STRUCTURED_ERROR_RES,
+    _drop_near_duplicates, _finditer_clauses, _read_transcript
+)
+
+
+def test_extract_all_runs_every_extractor():
+    """extract_all finds what its extractors find when run one by one."""
+    extractor = MemoryExtractor()
+    text = "The solution to users now the fix is endpoint retries with backoff."
+    extractors = [
+        extractor.extract_forgotten_items, extractor.extract_confirmed_solutions,
+        extractor.extract_user_needs, extractor.extract_solutions,
+        extractor.extract_error_patterns, extractor.extract_antipatterns,
+    ]
+    expected = [memory for extract in extractors for memory in extract(text)]
+    expected.sort(key=lambda m: m.get('importance', 0), reverse=True)
+
+    assert extractor.extract_all(text) == expected
+    assert [m['type'] for m in expected] == ['solution', 'error']
+
+
+def test_info_separators_count_as_whitespace():
+    """ASCII \\x1c-\\x1f are whitespace to re's \\s."""
+    extractor = MemoryExtractor()
+    needs = extractor.extract_all("please\x1cfix the broken database connection now.")
+    assert [m['type'] for m in needs] == ['user_need']
+
+
+def test_markers_survive_lines_only_json_accepts(tmp_path):
+    """A lone surrogate escape or NaN elsewhere must not drop the transcript."""
+    transcript = tmp_path / 't.jsonl'
+    transcript.write_text(
+        '{"role": "assistant", "content": "[MEMORY #db] Use pgbouncer pooling"}\n'
+        '{"role": "user", "content": "cut mid-emoji \\ud83d"}\n'
+        '{"role": "user", "content": "ratio", "score": NaN}\n'
+    )
+    concentrator = AutoConcentrator(project_path=str(tmp_path))
+
+    assert concentrator.process_memory_markers(str(transcript)) == {'memories': 1, 'archives': 0}
+    assert _read_transcript(str(transcript), 3) is not None
+
+
+def test_store_memories_rolls_back_when_index_save_fails(tmp_path):
+    """A failed batch save stores nothing, in memory or on disk, so a retry stores once."""
+    concentrator = AutoConcentrator(project_path=str(tmp_path))
+    memories = [{
+        'type': 'solution',
+        'problem': 'Slow order lookups',
+        'solution': 'Add an index on orders.user_id',
+        'tags': ['database'],
+    }]
+    index_path = concentrator.bm.index_path
+    before = copy.deepcopy(concentrator.bm.index)
+    concentrator.bm.index_path = tmp_path / 'missing' / 'berry_index.json'
+
+    assert concentrator._store_memories(memories) == []
+    assert concentrator.bm.index == before
+
+    concentrator.bm.index_path = index_path
+    assert concentrator._store_memories(memories) == memories
+    assert len(concentrator.bm.index['solutions']) == 1
+
+
+def test_near_duplicates_of_different_types_are_kept():
+    """A solution is not merged into a near-identical confirmed solution."""
+    solution = {
+        'type': 'solution',
+        'problem': 'Imports fail under pytest',
+        'solution': 'setting PYTHONPATH before running pytest',
+        'tags': ['python'],
+    }
+    confirmed = {
+        'type': 'confirmed_solution',
+        'solution': 'setting PYTHONPATH before running pytest',
+        'tags': ['python'],
+        'importance': 8,
+    }
+    repeat = dict(solution, problem='General solution')
+
+    assert _drop_near_duplicates([solution, confirmed, repeat]) == [solution, confirmed]
+
+
+def write_transcripts(tmp_path):
+    """Two transcripts whose assistant turns each carry one memory marker."""
+    paths = []
+    for i, fix in enumerate(['pgbouncer pooling', 'an index on orders.user_id']):
+        transcript = tmp_path / f't{i}.jsonl'
+        transcript.write_text(
+            '{"role": "user", "content": "The queries are slow, really really slow."}\n'
+            '{"role": "assistant", "content": "[MEMORY #db] Fixed it with %s"}\n' % fix
+        )
+        paths.append(str(transcript))
+    return paths
+
+
+def test_concentrate_many_saves_index_once(tmp_path, monkeypatch):
+    """Learning and storing for every transcript share one index save."""
+    paths = write_transcripts(tmp_path)
+    concentrator = AutoConcentrator(project_path=str(tmp_path))
+    writes = []
+    sanitize = concentrator.bm._sanitize_index
+    monkeypatch.setattr(
+        concentrator.bm, '_sanitize_index', lambda: (writes.append(1), sanitize())
+    )
+
+    stored = concentrator.concentrate_many(paths + [str(tmp_path / 'missing.jsonl')],
+                                           max_workers=1)
+
+    assert len(stored) == 2
+    assert writes == [1]
+
+
+def test_concentrate_many_stores_nothing_when_index_save_fails(tmp_path):
+    """A failed save rolls back every transcript, and a retry stores them once."""
+    paths = write_transcripts(tmp_path)
+    concentrator = AutoConcentrator(project_path=str(tmp_path))
+    index_path = concentrator.bm.index_path
+    before = copy.deepcopy(concentrator.bm.index)
+    concentrator.bm.index_path = tmp_path / 'missing' / 'berry_index.json'
+
+    assert concentrator.concentrate_many(paths, max_workers=1) == []
+    assert concentrator.bm.index == before
+
+    concentrator.bm.index_path = index_path
+    assert len(concentrator.concentrate_many(paths, max_workers=1)) == 2
+
+
+def test_request_patterns_keep_overlapping_matches():
+    """Each request pattern scans on its own, so overlapping needs all survive."""
+    extractor = MemoryExtractor()
+    needs = extractor.extract_user_needs("Please look at this, i need the database pool resized.")
+
+    assert [m['need'] for m in needs] == [
+        'look at this, i need the database pool resized',
+        'the database pool resized',
+    ]
+
+
+def test_solution_patterns_report_in_pattern_order():
+    """Solutions come back pattern by pattern, not in text order."""
+    extractor = MemoryExtractor()
+    text = ("You should restart the worker pool every night. "
+            "The fix is to raise the connection pool size limit.")
+
+    assert [m['solution'] for m in extractor.extract_solutions(text)] == [
+        'to raise the connection pool size limit',
+        'restart the worker pool every night',
+    ]
+
+
+def test_same_fix_for_different_problems_is_stored_twice(tmp_path):
+    """Only a repeat of both problem and solution counts as already stored."""
+    concentrator = AutoConcentrator(project_path=str(tmp_path))
+    first = {
+        'type': 'solution',
+        'problem': 'Why do uploads time out?',
+        'solution': 'Raise the nginx proxy_read_timeout to 300 seconds',
+        'tags': ['server'],
+    }
+    second = dict(first, problem='Why does the report export hang?')
+
+    assert concentrator._store_memories([first]) == [first]
+    assert concentrator._store_memories([second]) == [second]
+    assert concentrator._store_memories([dict(first)]) == []
+
+
+def test_finditer_clauses_matches_finditer():
+    """Clause-bounded scanning finds exactly what re's own scan finds."""
+    pattern, tail = _STRUCTURED_ERROR_RES[2], _CAUSE_TAIL_RE
+    texts = [
+        "The outage was caused by a full disk. Retries were due to  timeouts.",
+        " caused by nothing. x due to y",
+        "no trigger here. none here either",
+        "a leak caused by. the pool" + " word" * 300 + ". It was due to load",
+        "Due To x.. y CAUSED BY z",
+    ]
+    for text in texts:
+        expected = [(m.span(1), m.span(2)) for m in pattern.finditer(text)]
+        assert [(m.span(1), m.span(2)) for m in _finditer_clauses(pattern, tail, text)] == expected
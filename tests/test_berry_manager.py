@@ -0,0 +1,88 @@
+"""Tests for berry_manager.py."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from berry_manager import BerryManager
+
+
+@pytest.fixture
+def bm(tmp_path):
+    """A BerryManager storing under a temporary directory."""
+    return BerryManager(base_path=str(tmp_path))
+
+
+def count_index_writes(bm, monkeypatch):
+    """Count the index saves that actually reach disk."""
+    writes = []
+    sanitize = bm._sanitize_index
+
+    def counting_sanitize():
+        writes.append(1)
+        sanitize()
+
+    # Every real save sanitizes the index once; deferred saves do not
+    monkeypatch.setattr(bm, '_sanitize_index', counting_sanitize)
+    return writes
+
+
+def test_nested_batches_save_once(bm, monkeypatch):
+    """Saves inside nested batches are written once, at the outermost exit."""
+    writes = count_index_writes(bm, monkeypatch)
+
+    with bm.batch():
+        bm.add_solution("Problem one", "Solution one", ["tag1"])
+        with bm.batch():
+            bm.add_solution("Problem two", "Solution two", ["tag2"])
+        assert writes == []
+
+    assert writes == [1]
+    reloaded = BerryManager(base_path=str(bm.base_path))
+    assert len(reloaded.index['solutions']) == 2
+
+
+def test_batch_saves_when_block_raises(bm, monkeypatch):
+    """Updates made before an exception are still saved."""
+    writes = count_index_writes(bm, monkeypatch)
+
+    with pytest.raises(ValueError):
+        with bm.batch():
+            bm.add_solution("Problem", "Solution", ["tag1"])
+            raise ValueError("boom")
+
+    assert writes == [1]
+    reloaded = BerryManager(base_path=str(bm.base_path))
+    assert len(reloaded.index['solutions']) == 1
+
+
+def test_batch_without_updates_does_not_save(bm, monkeypatch):
+    """A batch in which nothing asked for a save writes nothing."""
+    writes = count_index_writes(bm, monkeypatch)
+
+    with bm.batch():
+        bm.search_solutions("anything")
+
+    assert writes == []
+
+
+def test_batch_rolls_back_when_save_fails(bm):
+    """A failed save leaves the in-memory index as it was before the batch."""
+    bm.add_solution("Problem one", "Solution one", ["tag1"])
+    index_path = bm.index_path
+    bm.index_path = bm.base_path / 'missing' / 'berry_index.json'
+
+    with pytest.raises(RuntimeError):
+        with bm.batch():
+            bm.add_solution("Problem two", "Solution two", ["tag2"])
+            bm.learn_signals([("urgent", "emphasis", 1)])
+
+    assert [s['problem'] for s in bm.index['solutions']] == ["Problem one"]
+    assert bm.index['learned_signals']['emphasis'] == {}
+
+    bm.index_path = index_path
+    reloaded = BerryManager(base_path=str(bm.base_path))
+    assert [s['problem'] for s in reloaded.index['solutions']] == ["Problem one"]